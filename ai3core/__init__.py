@@ -13,6 +13,9 @@ This is Stovepipe 1: The core decision engine that handles:
 
 __version__ = "1.0.0"
 
-from .engine import Ai3Engine
+from .engine import Ai3Core
 
-__all__ = ["Ai3Engine"]
+# Name used by the documentation and existing integrations
+Ai3Engine = Ai3Core
+
+__all__ = ["Ai3Core", "Ai3Engine"]
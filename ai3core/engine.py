@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import Dict, List, Optional, AsyncIterator
+from typing import Callable, Dict, List, Optional
 from ai3core.planner import make_plan
 from ai3core.router.selector import select_provider
 from ai3core.executor.scheduler import compute_ready_sets, ConcurrencyLimiter
@@ -20,17 +20,29 @@ class Ai3Core:
         self.journal = JournalStore()
         self.telemetry = TelemetryCollector()
         self.limiter = ConcurrencyLimiter(AI3_MAX_CONCURRENCY, AI3_MAX_CONCURRENCY_PER_PROVIDER)
+        self._providers: Dict[str, object] = {}
 
     def _get_provider_instance(self, provider_name: str):
-        """Instantiate provider by name."""
-        if "anthropic" in provider_name.lower():
-            return AnthropicProvider()
-        elif "openai" in provider_name.lower():
-            return OpenAIProvider()
+        """Get provider by name, reusing instances (and their clients) across runs."""
+        if "openai" in provider_name.lower():
+            key, factory = "openai", OpenAIProvider
         else:
-            return AnthropicProvider()  # Default fallback
-
-    async def _execute_task(self, task: Dict, artifacts: Dict, stream_cb=None) -> Dict:
+            key, factory = "anthropic", AnthropicProvider  # Default fallback
+        provider = self._providers.get(key)
+        if provider is None:
+            provider = self._providers[key] = factory()
+        return provider
+
+    async def aclose(self):
+        """Release provider clients and flush telemetry."""
+        for provider in self._providers.values():
+            close = getattr(provider, "aclose", None)
+            if close is not None:
+                await close()
+        self._providers.clear()
+        self.telemetry.close()
+
+    async def _execute_task(self, task: Dict, artifacts: Dict, run_metrics: Dict, stream_cb=None) -> Dict:
         """Execute a single task with verification, repair, and fallback."""
         task_id = task["id"]
         start_time = time.time()
@@ -41,7 +53,7 @@ class Ai3Core:
         # Select provider
         provider_name = select_provider(task, self.telemetry)
         score = 1.0  # Placeholder for actual score
-        self.telemetry.record_decision(task_id, provider_name, score)
+        self.telemetry.record_decision(run_metrics, task_id, provider_name, score)
 
         if stream_cb:
             await stream_cb({"type": "decision", "task_id": task_id, "provider": provider_name})
@@ -106,14 +118,14 @@ class Ai3Core:
             latency_ms = (time.time() - start_time) * 1000
             cost = response.get("usage", {}).get("cost", 0.001)
             tokens = response.get("usage", {}).get("total_tokens", 100)
-            self.telemetry.record_task(task_id, provider_name, True, latency_ms, cost, tokens)
+            self.telemetry.record_task(run_metrics, task_id, provider_name, True, latency_ms, cost, tokens)
 
             return artifact
 
         except Exception as e:
             self.limiter.release(provider_name)
             latency_ms = (time.time() - start_time) * 1000
-            self.telemetry.record_task(task_id, provider_name, False, latency_ms, 0.0, 0)
+            self.telemetry.record_task(run_metrics, task_id, provider_name, False, latency_ms, 0.0, 0)
 
             if stream_cb:
                 await stream_cb({"type": "task_failed", "task_id": task_id, "error": str(e)})
@@ -130,7 +142,8 @@ class Ai3Core:
         # Simple dependency injection (can be enhanced)
         return base
 
-    async def _execute_parallel(self, tasks: List[Dict], edges: List[Dict], stream_cb=None) -> Dict[str, Dict]:
+    async def _execute_parallel(self, tasks: List[Dict], edges: List[Dict], run_metrics: Dict,
+                                stream_cb=None) -> Dict[str, Dict]:
         """Execute tasks in parallel based on dependency graph."""
         ready_sets = compute_ready_sets(tasks, edges)
         artifacts = {}
@@ -140,7 +153,7 @@ class Ai3Core:
             # Execute all ready tasks concurrently
             ready_tasks = [task_map[tid] for tid in ready_set]
             results = await asyncio.gather(
-                *[self._execute_task(task, artifacts, stream_cb) for task in ready_tasks],
+                *[self._execute_task(task, artifacts, run_metrics, stream_cb) for task in ready_tasks],
                 return_exceptions=True
             )
 
@@ -156,15 +169,20 @@ class Ai3Core:
 
         return artifacts
 
-    async def run(self, user_input: str, stream: bool = False) -> AsyncIterator[Dict] if stream else Dict:
-        """Main orchestration loop with optional streaming."""
+    async def run(self, user_input: str, stream: bool = False,
+                  on_event: Optional[Callable[[Dict], None]] = None) -> Optional[Dict]:
+        """Main orchestration loop with optional streaming.
+
+        When streaming, every event is passed to on_event as it happens and
+        None is returned; otherwise the run result dict is returned.
+        """
         run_id = self.journal.create_run(user_input)
+        run_metrics = self.telemetry.start_run()
 
         async def emit(event: Dict):
-            if stream and stream_cb:
-                await stream_cb(event)
+            on_event(event)
 
-        stream_cb = emit if stream else None
+        stream_cb = emit if stream and on_event else None
 
         try:
             # Planning
@@ -181,6 +199,7 @@ class Ai3Core:
             artifacts = await self._execute_parallel(
                 task_graph["tasks"],
                 task_graph["edges"],
+                run_metrics,
                 stream_cb
             )
 
@@ -194,7 +213,7 @@ class Ai3Core:
                 await stream_cb({"type": "final", "output": final_output})
 
             # Finalize
-            stats = self.telemetry.finalize_run()
+            stats = self.telemetry.finalize_run(run_metrics)
             self.journal.save_result(run_id, final_output, stats)
 
             if stream_cb:
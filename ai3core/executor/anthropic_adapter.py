@@ -12,17 +12,17 @@ from ..types import ExecutionArtifact, ModelProvider, Task
 class AnthropicAdapter(BaseExecutor):
     """Adapter for Anthropic Claude models"""
 
-    VALID_MODELS = [
+    VALID_MODELS = frozenset({
         "claude-3-7-sonnet-20250219",
         "claude-3-5-sonnet-20241022",
         "claude-3-opus-20240229",
         "claude-3-sonnet-20240229",
         "claude-3-haiku-20240307"
-    ]
+    })
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, registry=None):
         """Initialize Anthropic adapter"""
-        super().__init__(api_key, ModelProvider.ANTHROPIC)
+        super().__init__(api_key, ModelProvider.ANTHROPIC, registry)
         self.client = Anthropic(api_key=api_key)
 
     def execute(self, task: Task, model_id: str, system_prompt: Optional[str] = None,
@@ -126,4 +126,4 @@ class AnthropicAdapter(BaseExecutor):
 
     def validate_model(self, model_id: str) -> bool:
         """Check if model_id is a valid Claude model"""
-        return model_id in self.VALID_MODELS
+        return self._is_known_model(model_id)
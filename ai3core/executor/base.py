@@ -3,10 +3,13 @@ Base executor interface for AI providers
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, AbstractSet, Dict, Any, Optional
 from datetime import datetime
 from ..types import ExecutionArtifact, ModelProvider, Task
 
+if TYPE_CHECKING:
+    from ..registry import CapabilityRegistry
+
 
 class BaseExecutor(ABC):
     """
@@ -15,16 +18,23 @@ class BaseExecutor(ABC):
     All adapters must implement this interface to ensure uniform behavior
     """
 
-    def __init__(self, api_key: str, provider: ModelProvider):
+    # Models the adapter accepts when no registry entry says otherwise; a
+    # frozenset so validation is a single hash lookup
+    VALID_MODELS: AbstractSet[str] = frozenset()
+
+    def __init__(self, api_key: str, provider: ModelProvider,
+                 registry: Optional["CapabilityRegistry"] = None):
         """
         Initialize the executor
 
         Args:
             api_key: API key for the provider
             provider: ModelProvider enum value
+            registry: Optional shared CapabilityRegistry used to validate models
         """
         self.api_key = api_key
         self.provider = provider
+        self.registry = registry
         self.default_max_tokens = 4096
         self.default_temperature = 0.7
 
@@ -64,6 +74,18 @@ class BaseExecutor(ABC):
         """
         pass
 
+    def _is_known_model(self, model_id: str) -> bool:
+        """
+        Check model_id against the registry, falling back to VALID_MODELS
+
+        The registry is authoritative for models it knows about.
+        """
+        if self.registry is not None:
+            capability = self.registry.get_capability(model_id)
+            if capability is not None:
+                return capability.provider == self.provider
+        return model_id in self.VALID_MODELS
+
     def _create_artifact(self, task: Task, model_id: str, prompt: str, response: str,
                         token_usage: Dict[str, int], latency_ms: float,
                         success: bool = True, error: Optional[str] = None,
@@ -17,15 +17,17 @@ class ExecutorFactory:
     Handles initialization and caching of adapters for different providers
     """
 
-    def __init__(self, api_keys: Dict[str, str]):
+    def __init__(self, api_keys: Dict[str, str], registry=None):
         """
         Initialize the factory
 
         Args:
             api_keys: Dict mapping provider names to API keys
                      e.g., {"anthropic": "sk-...", "openai": "sk-...", "xai": "..."}
+            registry: Optional CapabilityRegistry shared with every executor
         """
         self.api_keys = api_keys
+        self.registry = registry
         self._executors: Dict[ModelProvider, BaseExecutor] = {}
 
     def get_executor(self, provider: ModelProvider) -> BaseExecutor:
@@ -60,11 +62,11 @@ class ExecutorFactory:
 
         # Create executor
         if provider == ModelProvider.ANTHROPIC:
-            executor = AnthropicAdapter(api_key)
+            executor = AnthropicAdapter(api_key, self.registry)
         elif provider == ModelProvider.OPENAI:
-            executor = OpenAIAdapter(api_key)
+            executor = OpenAIAdapter(api_key, self.registry)
         elif provider == ModelProvider.XAI:
-            executor = XAIAdapter(api_key)
+            executor = XAIAdapter(api_key, self.registry)
         else:
             raise ValueError(f"Unsupported provider: {provider.value}")
 
@@ -72,17 +74,25 @@ class ExecutorFactory:
         self._executors[provider] = executor
         return executor
 
-    def get_executor_for_model(self, model_id: str, registry) -> Optional[BaseExecutor]:
+    def get_executor_for_model(self, model_id: str, registry=None) -> Optional[BaseExecutor]:
         """
         Get executor for a specific model
 
         Args:
             model_id: Model identifier
-            registry: CapabilityRegistry to lookup model info
+            registry: CapabilityRegistry to lookup model info; defaults to the
+                      factory's registry
 
         Returns:
             BaseExecutor instance or None if model not found
+
+        Raises:
+            ValueError: If no registry is given and the factory has none
         """
+        if registry is None:
+            registry = self.registry
+        if registry is None:
+            raise ValueError("No CapabilityRegistry given and the factory was created without one")
         capability = registry.get_capability(model_id)
         if not capability:
             return None
@@ -12,17 +12,17 @@ from ..types import ExecutionArtifact, ModelProvider, Task
 class OpenAIAdapter(BaseExecutor):
     """Adapter for OpenAI GPT models"""
 
-    VALID_MODELS = [
+    VALID_MODELS = frozenset({
         "gpt-4o",
         "gpt-4o-mini",
         "gpt-4-turbo",
         "gpt-4",
         "gpt-3.5-turbo"
-    ]
+    })
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, registry=None):
         """Initialize OpenAI adapter"""
-        super().__init__(api_key, ModelProvider.OPENAI)
+        super().__init__(api_key, ModelProvider.OPENAI, registry)
         self.client = OpenAI(api_key=api_key)
 
     def execute(self, task: Task, model_id: str, system_prompt: Optional[str] = None,
@@ -131,4 +131,4 @@ class OpenAIAdapter(BaseExecutor):
 
     def validate_model(self, model_id: str) -> bool:
         """Check if model_id is a valid GPT model"""
-        return model_id in self.VALID_MODELS
+        return self._is_known_model(model_id)
@@ -1,30 +1,46 @@
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 import asyncio
+import heapq
 
 
-def topological_sort(tasks: List[Dict], edges: List[Dict]) -> List[str]:
-    """Return task IDs in topological order."""
-    # Build adjacency list
-    graph = {t["id"]: [] for t in tasks}
-    in_degree = {t["id"]: 0 for t in tasks}
+def _index_graph(tasks: List[Dict], edges: List[Dict]) -> Tuple[List[str], List[List[int]], List[int]]:
+    """
+    Number the distinct task IDs and build integer adjacency lists
+
+    Returns (ids, successors, in_degree), where ids[i] is the ID of node i.
+    """
+    index: Dict[str, int] = {}
+    for t in tasks:
+        index.setdefault(t["id"], len(index))
 
+    successors: List[List[int]] = [[] for _ in index]
+    in_degree = [0] * len(index)
     for edge in edges:
-        graph[edge["from"]].append(edge["to"])
-        in_degree[edge["to"]] += 1
+        target = index[edge["to"]]
+        successors[index[edge["from"]]].append(target)
+        in_degree[target] += 1
+
+    return list(index), successors, in_degree
+
+
+def topological_sort(tasks: List[Dict], edges: List[Dict]) -> List[str]:
+    """Return task IDs in topological order."""
+    ids, successors, in_degree = _index_graph(tasks, edges)
 
-    # Kahn's algorithm
-    queue = [tid for tid, deg in in_degree.items() if deg == 0]
+    # Kahn's algorithm; the heap always yields the smallest ready ID, for
+    # deterministic ordering
+    heap = [(tid, i) for i, tid in enumerate(ids) if in_degree[i] == 0]
+    heapq.heapify(heap)
     result = []
 
-    while queue:
-        queue.sort()  # Deterministic ordering
-        node = queue.pop(0)
+    while heap:
+        node, i = heapq.heappop(heap)
         result.append(node)
 
-        for neighbor in graph[node]:
-            in_degree[neighbor] -= 1
-            if in_degree[neighbor] == 0:
-                queue.append(neighbor)
+        for j in successors[i]:
+            in_degree[j] -= 1
+            if in_degree[j] == 0:
+                heapq.heappush(heap, (ids[j], j))
 
     if len(result) != len(tasks):
         raise ValueError("Cycle detected in task graph")
@@ -34,26 +50,28 @@ def topological_sort(tasks: List[Dict], edges: List[Dict]) -> List[str]:
 
 def compute_ready_sets(tasks: List[Dict], edges: List[Dict]) -> List[Set[str]]:
     """Return list of sets, each containing task IDs that can run in parallel."""
-    # Build dependency map
-    dependencies = {t["id"]: set() for t in tasks}
-    for edge in edges:
-        dependencies[edge["to"]].add(edge["from"])
+    ids, successors, in_degree = _index_graph(tasks, edges)
 
+    # Kahn's algorithm by level: a node joins the wave after the one in which
+    # its last dependency ran
     ready_sets = []
-    completed = set()
-    task_ids = {t["id"] for t in tasks}
-
-    while len(completed) < len(tasks):
-        ready = set()
-        for tid in task_ids - completed:
-            if dependencies[tid].issubset(completed):
-                ready.add(tid)
-
-        if not ready:
-            raise ValueError("No ready tasks found; possible cycle")
-
-        ready_sets.append(ready)
-        completed.update(ready)
+    wave = [i for i, degree in enumerate(in_degree) if degree == 0]
+    scheduled = 0
+
+    while wave:
+        ready_sets.append({ids[i] for i in wave})
+        scheduled += len(wave)
+
+        next_wave = []
+        for i in wave:
+            for j in successors[i]:
+                in_degree[j] -= 1
+                if in_degree[j] == 0:
+                    next_wave.append(j)
+        wave = next_wave
+
+    if scheduled != len(tasks):
+        raise ValueError("No ready tasks found; possible cycle")
 
     return ready_sets
 
@@ -12,17 +12,17 @@ from ..types import ExecutionArtifact, ModelProvider, Task
 class XAIAdapter(BaseExecutor):
     """Adapter for xAI Grok models"""
 
-    VALID_MODELS = [
+    VALID_MODELS = frozenset({
         "grok-3",
         "grok-2-latest",
         "grok-2"
-    ]
+    })
 
     API_BASE_URL = "https://api.x.ai/v1/chat/completions"
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, registry=None):
         """Initialize xAI adapter"""
-        super().__init__(api_key, ModelProvider.XAI)
+        super().__init__(api_key, ModelProvider.XAI, registry)
 
     def execute(self, task: Task, model_id: str, system_prompt: Optional[str] = None,
                 max_tokens: Optional[int] = None, temperature: Optional[float] = None,
@@ -144,4 +144,4 @@ class XAIAdapter(BaseExecutor):
 
     def validate_model(self, model_id: str) -> bool:
         """Check if model_id is a valid Grok model"""
-        return model_id in self.VALID_MODELS
+        return self._is_known_model(model_id)
@@ -2,12 +2,17 @@
 Artifact Store - Stores execution artifacts with metadata
 """
 
-import json
 import os
+import orjson
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
-from ..types import ExecutionArtifact
+from ..types import ExecutionArtifact, ModelProvider
+
+# orjson options: stringify non-str dict keys (as json.dump did) and either
+# pretty-print a whole file or end a log record with a newline
+_INDENT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+_LINE = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
 
 
 class ArtifactStore:
@@ -15,8 +20,8 @@ class ArtifactStore:
     Persistent storage for execution artifacts
 
     Stores:
-    - Raw artifacts (prompts, responses, metadata)
-    - Indexed by task_id, model_id, timestamp
+    - Raw artifacts (prompts, responses, metadata), appended to one JSONL log
+    - Indexed by task_id, model_id, timestamp, with each artifact's log offset
     - Searchable and retrievable
     """
 
@@ -30,21 +35,22 @@ class ArtifactStore:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
 
-        # Index file
+        # Append-only artifact log and its index
+        self.log_file = self.storage_dir / "artifacts.jsonl"
         self.index_file = self.storage_dir / "index.json"
         self.index: Dict[str, Any] = self._load_index()
 
     def _load_index(self) -> Dict[str, Any]:
         """Load or create index"""
         if self.index_file.exists():
-            with open(self.index_file, 'r') as f:
-                return json.load(f)
+            with open(self.index_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {"artifacts": {}, "by_task": {}, "by_model": {}, "by_date": {}}
 
     def _save_index(self):
         """Persist index to disk"""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        with open(self.index_file, 'wb') as f:
+            f.write(orjson.dumps(self.index, option=_INDENT))
 
     def store(self, artifact: ExecutionArtifact) -> str:
         """
@@ -56,13 +62,35 @@ class ArtifactStore:
         Returns:
             Artifact ID (storage key)
         """
+        with open(self.log_file, 'ab') as log:
+            artifact_id = self._write_artifact(log, artifact)
+        self._save_index()
+
+        return artifact_id
+
+    def store_many(self, artifacts: List[ExecutionArtifact]) -> List[str]:
+        """
+        Store several artifacts, rewriting the index once at the end
+
+        Args:
+            artifacts: Artifacts to store
+
+        Returns:
+            Artifact IDs, in the same order
+        """
+        with open(self.log_file, 'ab') as log:
+            artifact_ids = [self._write_artifact(log, artifact) for artifact in artifacts]
+        if artifact_ids:
+            self._save_index()
+
+        return artifact_ids
+
+    def _write_artifact(self, log: BinaryIO, artifact: ExecutionArtifact) -> str:
+        """Append an artifact to the open log and add it to the in-memory index"""
         # Generate storage key
         timestamp_str = artifact.timestamp.strftime("%Y%m%d_%H%M%S")
         artifact_id = f"{artifact.task_id}_{artifact.model_id}_{timestamp_str}"
 
-        # Store artifact file
-        artifact_file = self.storage_dir / f"{artifact_id}.json"
-
         artifact_data = {
             "task_id": artifact.task_id,
             "model_id": artifact.model_id,
@@ -77,8 +105,9 @@ class ArtifactStore:
             "error": artifact.error
         }
 
-        with open(artifact_file, 'w') as f:
-            json.dump(artifact_data, f, indent=2)
+        # One line per artifact; the index records where it starts
+        offset = log.tell()
+        log.write(orjson.dumps(artifact_data, option=_LINE))
 
         # Update index
         date_key = artifact.timestamp.strftime("%Y-%m-%d")
@@ -88,7 +117,7 @@ class ArtifactStore:
             "model_id": artifact.model_id,
             "timestamp": artifact.timestamp.isoformat(),
             "success": artifact.success,
-            "file": str(artifact_file)
+            "offset": offset
         }
 
         # Index by task
@@ -106,8 +135,6 @@ class ArtifactStore:
             self.index["by_date"][date_key] = []
         self.index["by_date"][date_key].append(artifact_id)
 
-        self._save_index()
-
         return artifact_id
 
     def retrieve(self, artifact_id: str) -> Optional[ExecutionArtifact]:
@@ -120,42 +147,44 @@ class ArtifactStore:
         Returns:
             ExecutionArtifact or None if not found
         """
-        if artifact_id not in self.index["artifacts"]:
-            return None
-
-        artifact_file = Path(self.index["artifacts"][artifact_id]["file"])
-
-        if not artifact_file.exists():
-            return None
-
-        with open(artifact_file, 'r') as f:
-            data = json.load(f)
-
-        from ..types import ModelProvider
-
-        return ExecutionArtifact(
-            task_id=data["task_id"],
-            model_id=data["model_id"],
-            provider=ModelProvider(data["provider"]),
-            prompt=data["prompt"],
-            response=data["response"],
-            metadata=data["metadata"],
-            token_usage=data["token_usage"],
-            latency_ms=data["latency_ms"],
-            timestamp=datetime.fromisoformat(data["timestamp"]),
-            success=data["success"],
-            error=data.get("error")
-        )
+        return next(self._load_artifacts([artifact_id]), None)
+
+    def _load_artifacts(self, artifact_ids: Iterable[str]) -> Iterator[ExecutionArtifact]:
+        """Yield the stored artifacts for the given IDs, opening the log at most once"""
+        log = None
+        try:
+            for artifact_id in artifact_ids:
+                entry = self.index["artifacts"].get(artifact_id)
+                if entry is None:
+                    continue
+
+                if "offset" in entry:
+                    if log is None:
+                        if not self.log_file.exists():
+                            continue
+                        log = open(self.log_file, 'rb')
+                    log.seek(entry["offset"])
+                    data = orjson.loads(log.readline())
+                else:
+                    # Stores written before the log kept one file per artifact
+                    artifact_file = Path(entry["file"])
+                    if not artifact_file.exists():
+                        continue
+                    with open(artifact_file, 'rb') as f:
+                        data = orjson.loads(f.read())
+
+                yield _artifact_from_data(data)
+        finally:
+            if log is not None:
+                log.close()
 
     def get_by_task(self, task_id: str) -> List[ExecutionArtifact]:
         """Get all artifacts for a task"""
-        artifact_ids = self.index["by_task"].get(task_id, [])
-        return [a for a in (self.retrieve(aid) for aid in artifact_ids) if a]
+        return list(self._load_artifacts(self.index["by_task"].get(task_id, [])))
 
     def get_by_model(self, model_id: str) -> List[ExecutionArtifact]:
         """Get all artifacts from a specific model"""
-        artifact_ids = self.index["by_model"].get(model_id, [])
-        return [a for a in (self.retrieve(aid) for aid in artifact_ids) if a]
+        return list(self._load_artifacts(self.index["by_model"].get(model_id, [])))
 
     def get_by_date(self, date: str) -> List[ExecutionArtifact]:
         """
@@ -164,8 +193,7 @@ class ArtifactStore:
         Args:
             date: Date string in YYYY-MM-DD format
         """
-        artifact_ids = self.index["by_date"].get(date, [])
-        return [a for a in (self.retrieve(aid) for aid in artifact_ids) if a]
+        return list(self._load_artifacts(self.index["by_date"].get(date, [])))
 
     def get_recent(self, limit: int = 10) -> List[ExecutionArtifact]:
         """Get most recent artifacts"""
@@ -173,7 +201,7 @@ class ArtifactStore:
         all_ids.sort(reverse=True)  # Sort by timestamp (newest first)
 
         recent_ids = all_ids[:limit]
-        return [a for a in (self.retrieve(aid) for aid in recent_ids) if a]
+        return list(self._load_artifacts(recent_ids))
 
     def search(self, query: str) -> List[ExecutionArtifact]:
         """
@@ -185,18 +213,12 @@ class ArtifactStore:
         Returns:
             List of matching artifacts
         """
-        matches = []
-
-        for artifact_id in self.index["artifacts"].keys():
-            artifact = self.retrieve(artifact_id)
-            if not artifact:
-                continue
-
+        query = query.lower()
+        return [
+            artifact for artifact in self._load_artifacts(self.index["artifacts"].keys())
             # Search in prompt and response
-            if query.lower() in artifact.prompt.lower() or query.lower() in artifact.response.lower():
-                matches.append(artifact)
-
-        return matches
+            if query in artifact.prompt.lower() or query in artifact.response.lower()
+        ]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
@@ -214,7 +236,9 @@ class ArtifactStore:
 
     def clear(self):
         """Clear all artifacts (use with caution!)"""
-        # Remove all artifact files
+        # Remove the artifact log and any per-artifact files from older stores
+        if self.log_file.exists():
+            self.log_file.unlink()
         for artifact_file in self.storage_dir.glob("*.json"):
             if artifact_file.name != "index.json":
                 artifact_file.unlink()
@@ -222,3 +246,20 @@ class ArtifactStore:
         # Reset index
         self.index = {"artifacts": {}, "by_task": {}, "by_model": {}, "by_date": {}}
         self._save_index()
+
+
+def _artifact_from_data(data: Dict[str, Any]) -> ExecutionArtifact:
+    """Rebuild an artifact from its stored representation"""
+    return ExecutionArtifact(
+        task_id=data["task_id"],
+        model_id=data["model_id"],
+        provider=ModelProvider(data["provider"]),
+        prompt=data["prompt"],
+        response=data["response"],
+        metadata=data["metadata"],
+        token_usage=data["token_usage"],
+        latency_ms=data["latency_ms"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        success=data["success"],
+        error=data.get("error")
+    )
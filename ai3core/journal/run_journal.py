@@ -2,12 +2,15 @@
 Run Journal - Records complete execution traces
 """
 
-import json
+import orjson
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from ..types import RunTrace, TaskGraph, ExecutionArtifact, VerificationResult, AssembledResponse
 
+# Pretty-printed like json.dump(indent=2); non-str dict keys are stringified as json did
+_INDENT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 class RunJournal:
     """
@@ -40,14 +43,14 @@ class RunJournal:
     def _load_index(self) -> Dict[str, Any]:
         """Load or create index"""
         if self.index_file.exists():
-            with open(self.index_file, 'r') as f:
-                return json.load(f)
+            with open(self.index_file, 'rb') as f:
+                return orjson.loads(f.read())
         return {"runs": {}, "by_date": {}}
 
     def _save_index(self):
         """Persist index to disk"""
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index, f, indent=2)
+        with open(self.index_file, 'wb') as f:
+            f.write(orjson.dumps(self.index, option=_INDENT))
 
     def record(self, trace: RunTrace) -> str:
         """
@@ -64,8 +67,8 @@ class RunJournal:
 
         run_data = self._serialize_trace(trace)
 
-        with open(run_file, 'w') as f:
-            json.dump(run_data, f, indent=2)
+        with open(run_file, 'wb') as f:
+            f.write(orjson.dumps(run_data, option=_INDENT))
 
         # Update index
         date_key = trace.timestamp.strftime("%Y-%m-%d")
@@ -107,8 +110,8 @@ class RunJournal:
         if not run_file.exists():
             return None
 
-        with open(run_file, 'r') as f:
-            data = json.load(f)
+        with open(run_file, 'rb') as f:
+            data = orjson.loads(f.read())
 
         return self._deserialize_trace(data)
 
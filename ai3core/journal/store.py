@@ -1,14 +1,19 @@
-import json
+import orjson
 import time
 from pathlib import Path
 from typing import Dict, Optional
-from ai3core.settings import JOURNAL_DIR
+from ai3core.settings import JOURNAL_DIR, ensure_dirs
+
+# orjson options; non-str dict keys are stringified as json.dump did
+_INDENT = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+_LINE = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
 
 
 class JournalStore:
     """Persist run traces and events for streaming playback."""
 
     def __init__(self):
+        ensure_dirs()
         self.journal_dir = JOURNAL_DIR
 
     def create_run(self, user_input: str) -> str:
@@ -25,8 +30,8 @@ class JournalStore:
     def save_plan(self, run_id: str, task_graph: Dict):
         """Save task graph plan."""
         run_path = self.journal_dir / run_id
-        with open(run_path / "plan.json", "w") as f:
-            json.dump(task_graph, f, indent=2)
+        with open(run_path / "plan.json", "wb") as f:
+            f.write(orjson.dumps(task_graph, option=_INDENT))
 
     def save_result(self, run_id: str, output: str, stats: Dict):
         """Save final output and stats."""
@@ -35,13 +40,13 @@ class JournalStore:
         with open(run_path / "output.txt", "w") as f:
             f.write(output)
 
-        with open(run_path / "stats.json", "w") as f:
-            json.dump(stats, f, indent=2)
+        with open(run_path / "stats.json", "wb") as f:
+            f.write(orjson.dumps(stats, option=_INDENT))
 
     def append_event(self, run_id: str, event: Dict):
         """Append streaming event to trace log."""
         run_path = self.journal_dir / run_id
         trace_file = run_path / "trace.jsonl"
 
-        with open(trace_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        with open(trace_file, "ab") as f:
+            f.write(orjson.dumps(event, option=_LINE))
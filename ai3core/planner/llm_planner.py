@@ -1,10 +1,17 @@
 import json
 import re
+import orjson
 from typing import Any, Dict, List
 from ai3core.providers.anthropic import AnthropicProvider
 from ai3core.settings import AI3_PLANNER_MODEL, AI3_PLANNER_MAXTOK, AI3_PLANNER_TEMPERATURE
 
 
+# Patterns used by auto_repair_json
+_MD_FENCE_RE = re.compile(r"```(?:json)?\s*")
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
+
+
 PLANNING_PROMPT_TEMPLATE = """You are a task planning agent. Given a user request, decompose it into a directed acyclic graph (DAG) of tasks.
 
 Output ONLY valid JSON matching this schema:
@@ -37,22 +44,30 @@ Return ONLY the JSON object, no markdown fences, no prose."""
 
 def auto_repair_json(raw: str) -> Dict[str, Any]:
     """Attempt to fix common JSON issues: strip prose, balance brackets, convert JSON5."""
+    # Well-formed output (the common case) needs no repair. orjson's decode
+    # error subclasses json.JSONDecodeError, which is what is caught here and
+    # by callers
+    try:
+        return orjson.loads(raw)
+    except json.JSONDecodeError:
+        pass
+
     # Strip markdown code fences
-    raw = re.sub(r"```(?:json)?\s*", "", raw)
+    raw = _MD_FENCE_RE.sub("", raw)
     raw = raw.strip()
 
     # Try direct parse
     try:
-        return json.loads(raw)
+        return orjson.loads(raw)
     except json.JSONDecodeError:
         pass
 
     # Extract first { ... } block
-    match = re.search(r"\{.*\}", raw, re.DOTALL)
+    match = _JSON_OBJECT_RE.search(raw)
     if match:
         candidate = match.group(0)
         try:
-            return json.loads(candidate)
+            return orjson.loads(candidate)
         except json.JSONDecodeError:
             pass
 
@@ -65,11 +80,11 @@ def auto_repair_json(raw: str) -> Dict[str, Any]:
         raw = "{" * (close_braces - open_braces) + raw
 
     try:
-        return json.loads(raw)
+        return orjson.loads(raw)
     except json.JSONDecodeError:
         # Last resort: strip trailing commas (JSON5 compatibility)
-        raw = re.sub(r",\s*([\]}])", r"\1", raw)
-        return json.loads(raw)
+        raw = _TRAILING_COMMA_RE.sub(r"\1", raw)
+        return orjson.loads(raw)
 
 
 def validate_task_graph(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -81,9 +96,14 @@ def validate_task_graph(data: Dict[str, Any]) -> Dict[str, Any]:
         data["edges"] = []
 
     # Validate task IDs are unique
-    task_ids = {t.get("id") for t in data["tasks"]}
-    if len(task_ids) != len(data["tasks"]):
-        raise ValueError("Duplicate task IDs detected")
+    ids = [t.get("id") for t in data["tasks"]]
+    task_ids = set(ids)
+    if len(task_ids) != len(ids):
+        seen = set()
+        for task_id in ids:
+            if task_id in seen:
+                raise ValueError(f"Duplicate task IDs detected: {task_id}")
+            seen.add(task_id)
 
     # Validate edges reference existing tasks
     for edge in data["edges"]:
@@ -1,10 +1,27 @@
 import json
+import os
 from pathlib import Path
 from ai3core.settings import REGISTRY_DIR
 
+REGISTRY_PATH = REGISTRY_DIR / "capabilities.json"
+
+# Parsed registry, re-read only when the file's mtime changes
+_REG_CACHE = {"mtime": 0, "data": None}
+
 
 def load_registry() -> dict:
     """Load provider registry from capabilities.json."""
-    registry_file = REGISTRY_DIR / "capabilities.json"
-    with open(registry_file, "r") as f:
+    with open(REGISTRY_PATH, "r") as f:
         return json.load(f)
+
+
+def cached_registry() -> dict:
+    """Return the parsed registry, reloading only if capabilities.json changed.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    mtime = os.stat(REGISTRY_PATH).st_mtime_ns
+    if mtime != _REG_CACHE["mtime"] or _REG_CACHE["data"] is None:
+        _REG_CACHE["data"] = json.loads(REGISTRY_PATH.read_bytes())
+        _REG_CACHE["mtime"] = mtime
+    return _REG_CACHE["data"]
@@ -2,13 +2,62 @@
 Capability Registry - Manages model capabilities and performance metrics
 """
 
-import json
 import os
+from collections import defaultdict, deque, namedtuple
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+from functools import lru_cache
+import orjson
 from ..types import ModelCapability, ModelProvider
 
+# Single telemetry sample; a namedtuple is far smaller than a per-call dict
+_Call = namedtuple("_Call", "ts success latency tokens cost")
+
+# Upper bound on samples kept per model inside the telemetry window
+MAX_RECENT_CALLS = 10000
+
+
+def _fresh_telem() -> Dict:
+    """Empty rolling telemetry for a model"""
+    return {
+        "recent_calls": deque(),
+        "sum_latency_ms": 0.0,  # Sum over recent_calls
+        "total_tokens": 0,
+        "total_cost": 0.0,
+        "success_count": 0,
+        "error_count": 0
+    }
+
+
+@lru_cache(maxsize=4)
+def _read_config(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a capabilities file, shared by every registry loading it
+
+    Keyed on the file's mtime so edits (including save_capabilities) are
+    picked up. Callers must treat the result as read-only.
+    """
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _cap_to_dict(cap: ModelCapability) -> Dict:
+    """Serialize a capability to its capabilities.json representation"""
+    return {
+        "provider": cap.provider.value,
+        "skills": cap.skills,
+        "context_window": cap.context_window,
+        "cost_per_1k_tokens": cap.cost_per_1k_tokens,
+        "avg_latency_ms": cap.avg_latency_ms,
+        "error_rate": cap.error_rate,
+        "supports_streaming": cap.supports_streaming,
+        "supports_vision": cap.supports_vision,
+        "supports_function_calling": cap.supports_function_calling,
+        "max_output_tokens": cap.max_output_tokens,
+        "notes": cap.metadata.get("notes", "")
+    }
+
 
 class CapabilityRegistry:
     """
@@ -33,16 +82,19 @@ class CapabilityRegistry:
 
         self.config_path = Path(config_path)
         self.capabilities: Dict[str, ModelCapability] = {}
-        self.telemetry: Dict[str, Dict] = {}  # Rolling metrics per model
+        self.telemetry: Dict[str, Dict] = defaultdict(_fresh_telem)  # Rolling metrics per model
         self.telemetry_window_hours = 24
 
+        # task_type -> full ranking, built on first request; cleared whenever
+        # a model or its error rate changes
+        self._rankings: Dict[str, List[tuple]] = {}
+
         self._load_capabilities()
 
     def _load_capabilities(self):
         """Load capabilities from JSON config"""
         try:
-            with open(self.config_path, 'r') as f:
-                data = json.load(f)
+            data = _read_config(str(self.config_path), os.stat(self.config_path).st_mtime_ns)
 
             self.telemetry_window_hours = data.get("telemetry_window_hours", 24)
 
@@ -53,7 +105,7 @@ class CapabilityRegistry:
                 capability = ModelCapability(
                     model_id=model_id,
                     provider=provider,
-                    skills=config.get("skills", {}),
+                    skills=dict(config.get("skills", {})),  # Own copy; the parsed config is shared
                     context_window=config.get("context_window", 8192),
                     cost_per_1k_tokens=config.get("cost_per_1k_tokens", 0.001),
                     avg_latency_ms=config.get("avg_latency_ms", 2000),
@@ -65,15 +117,7 @@ class CapabilityRegistry:
                     metadata={"notes": config.get("notes", "")}
                 )
                 self.capabilities[model_id] = capability
-
-                # Initialize telemetry tracking
-                self.telemetry[model_id] = {
-                    "recent_calls": [],
-                    "total_tokens": 0,
-                    "total_cost": 0.0,
-                    "success_count": 0,
-                    "error_count": 0
-                }
+                self.telemetry[model_id] = _fresh_telem()
 
         except Exception as e:
             raise ValueError(f"Failed to load capabilities from {self.config_path}: {e}")
@@ -122,25 +166,14 @@ class CapabilityRegistry:
             tokens_used: Total tokens consumed
             cost: Cost in dollars
         """
-        if model_id not in self.telemetry:
-            self.telemetry[model_id] = {
-                "recent_calls": [],
-                "total_tokens": 0,
-                "total_cost": 0.0,
-                "success_count": 0,
-                "error_count": 0
-            }
-
         telem = self.telemetry[model_id]
+        recent = telem["recent_calls"]
 
-        # Add to recent calls
-        telem["recent_calls"].append({
-            "timestamp": datetime.now(),
-            "success": success,
-            "latency_ms": latency_ms,
-            "tokens": tokens_used,
-            "cost": cost
-        })
+        # Add to recent calls, evicting the oldest sample when full
+        if len(recent) >= MAX_RECENT_CALLS:
+            telem["sum_latency_ms"] -= recent.popleft().latency
+        recent.append(_Call(datetime.now(), success, latency_ms, tokens_used, cost))
+        telem["sum_latency_ms"] += latency_ms
 
         # Update totals
         telem["total_tokens"] += tokens_used
@@ -152,11 +185,10 @@ class CapabilityRegistry:
             telem["error_count"] += 1
 
         # Clean old telemetry outside window
+        # Samples are appended in time order, so expired ones sit at the left
         cutoff = datetime.now() - timedelta(hours=self.telemetry_window_hours)
-        telem["recent_calls"] = [
-            call for call in telem["recent_calls"]
-            if call["timestamp"] > cutoff
-        ]
+        while recent and recent[0].ts <= cutoff:
+            telem["sum_latency_ms"] -= recent.popleft().latency
 
         # Update capability metrics based on recent data
         self._update_capability_metrics(model_id)
@@ -175,13 +207,17 @@ class CapabilityRegistry:
         capability = self.capabilities[model_id]
 
         # Update average latency
-        avg_latency = sum(c["latency_ms"] for c in recent) / len(recent)
+        avg_latency = telem["sum_latency_ms"] / len(recent)
         capability.avg_latency_ms = avg_latency
 
         # Update error rate
         total = telem["success_count"] + telem["error_count"]
         if total > 0:
-            capability.error_rate = telem["error_count"] / total
+            error_rate = telem["error_count"] / total
+            # Rankings only depend on error_rate, so keep them while it holds steady
+            if error_rate != capability.error_rate:
+                capability.error_rate = error_rate
+                self._rankings.clear()
 
     def get_live_metrics(self, model_id: str) -> Dict:
         """Get current telemetry metrics for a model"""
@@ -201,7 +237,7 @@ class CapabilityRegistry:
 
         return {
             "calls_in_window": len(recent),
-            "avg_latency_ms": sum(c["latency_ms"] for c in recent) / len(recent),
+            "avg_latency_ms": telem["sum_latency_ms"] / len(recent),
             "success_rate": telem["success_count"] / (telem["success_count"] + telem["error_count"]),
             "error_rate": telem["error_count"] / (telem["success_count"] + telem["error_count"]),
             "total_tokens": telem["total_tokens"],
@@ -219,72 +255,62 @@ class CapabilityRegistry:
         Returns:
             List of (model_id, score) tuples, sorted by score descending
         """
-        scores = []
-
-        for model_id, capability in self.capabilities.items():
-            # Base skill score
-            skill_score = capability.skills.get(task_type, 0.5)
-
-            # Check required features
-            if required_features:
-                if required_features.get("vision") and not capability.supports_vision:
-                    continue
-                if required_features.get("streaming") and not capability.supports_streaming:
-                    continue
-                if required_features.get("function_calling") and not capability.supports_function_calling:
-                    continue
-
-            # Adjust for current performance
-            error_penalty = capability.error_rate * 0.2  # Up to -0.2 for high error rate
-            final_score = skill_score - error_penalty
-
-            scores.append((model_id, final_score))
-
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores
+        scores = self._rankings.get(task_type)
+        if scores is None:
+            scores = []
+            for model_id, capability in self.capabilities.items():
+                # Base skill score
+                skill_score = capability.skills.get(task_type, 0.5)
+
+                # Adjust for current performance
+                error_penalty = capability.error_rate * 0.2  # Up to -0.2 for high error rate
+                final_score = skill_score - error_penalty
+
+                scores.append((model_id, final_score))
+
+            # Sort by score descending
+            scores.sort(key=lambda x: x[1], reverse=True)
+            self._rankings[task_type] = scores
+
+        if not required_features:
+            return list(scores)
+
+        # Check required features; filtering keeps the sorted order
+        capabilities = self.capabilities
+        ranked = []
+        for model_id, final_score in scores:
+            capability = capabilities[model_id]
+            if required_features.get("vision") and not capability.supports_vision:
+                continue
+            if required_features.get("streaming") and not capability.supports_streaming:
+                continue
+            if required_features.get("function_calling") and not capability.supports_function_calling:
+                continue
+            ranked.append((model_id, final_score))
+        return ranked
 
     def save_capabilities(self):
         """Persist current capabilities to JSON file"""
         data = {
-            "models": {},
+            "models": {model_id: _cap_to_dict(cap) for model_id, cap in self.capabilities.items()},
             "telemetry_window_hours": self.telemetry_window_hours,
             "last_updated": datetime.now().isoformat()
         }
 
-        for model_id, capability in self.capabilities.items():
-            data["models"][model_id] = {
-                "provider": capability.provider.value,
-                "skills": capability.skills,
-                "context_window": capability.context_window,
-                "cost_per_1k_tokens": capability.cost_per_1k_tokens,
-                "avg_latency_ms": capability.avg_latency_ms,
-                "error_rate": capability.error_rate,
-                "supports_streaming": capability.supports_streaming,
-                "supports_vision": capability.supports_vision,
-                "supports_function_calling": capability.supports_function_calling,
-                "max_output_tokens": capability.max_output_tokens,
-                "notes": capability.metadata.get("notes", "")
-            }
-
-        with open(self.config_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(self.config_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
     def add_model(self, capability: ModelCapability):
         """Add or update a model in the registry"""
         self.capabilities[capability.model_id] = capability
         if capability.model_id not in self.telemetry:
-            self.telemetry[capability.model_id] = {
-                "recent_calls": [],
-                "total_tokens": 0,
-                "total_cost": 0.0,
-                "success_count": 0,
-                "error_count": 0
-            }
+            self.telemetry[capability.model_id] = _fresh_telem()
+        self._rankings.clear()
 
     def remove_model(self, model_id: str):
         """Remove a model from the registry"""
         if model_id in self.capabilities:
             del self.capabilities[model_id]
+            self._rankings.clear()
         if model_id in self.telemetry:
             del self.telemetry[model_id]
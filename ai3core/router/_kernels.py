@@ -0,0 +1,89 @@
+"""
+Scoring kernels - Numeric model scoring over column-oriented registry data
+"""
+
+from typing import List, Sequence, Tuple
+
+# Normalization constants for the scoring function
+MAX_LATENCY_MS = 10000.0   # Latency at which the latency score reaches 0
+MAX_COST_PER_1K = 0.01     # Cost at which the cost score reaches 0
+
+
+def model_score(skill: float, error_rate: float, latency_ms: float, cost: float,
+                context_window: int, context_size: int, feature_score: float,
+                weights: Sequence[float]) -> float:
+    """
+    Weighted score of a single model
+
+    Args:
+        skill: Model proficiency for the task type (0-1)
+        error_rate: Current model error rate
+        latency_ms: Current average latency
+        cost: Cost per 1k tokens
+        context_window: Model context window in tokens
+        context_size: Required context size (0 = no requirement)
+        feature_score: Feature support score
+        weights: (skill_match, performance, cost, context_fit, features)
+
+    Returns:
+        Weighted score
+    """
+    w_skill, w_perf, w_cost, w_ctx, w_feat = weights
+
+    # Lower error rate and latency = higher score
+    latency_score = 1.0 - latency_ms / MAX_LATENCY_MS
+    if latency_score < 0.0:
+        latency_score = 0.0
+    performance_score = (1.0 - error_rate) * 0.7 + latency_score * 0.3
+
+    # Cheaper is better
+    cost_ratio = cost / MAX_COST_PER_1K
+    cost_score = 1.0 - (cost_ratio if cost_ratio < 1.0 else 1.0)
+
+    # Prefer models where context is 20-80% of window (sweet spot)
+    if context_size == 0:
+        context_score = 1.0
+    else:
+        utilization = context_size / context_window
+        if utilization < 0.2:
+            context_score = 0.8
+        elif utilization < 0.8:
+            context_score = 1.0
+        else:
+            context_score = 0.6
+
+    return (w_skill * skill + w_perf * performance_score + w_cost * cost_score +
+            w_ctx * context_score + w_feat * feature_score)
+
+
+def score_kernel(skills: Sequence[float], error_rates: Sequence[float],
+                 latencies: Sequence[float], costs: Sequence[float],
+                 context_windows: Sequence[int], context_size: int,
+                 feature_mask: Sequence[bool], feature_score: float,
+                 weights: Sequence[float]) -> Tuple[int, float]:
+    """
+    Find the best-scoring model in a single pass over parallel columns
+
+    Models masked out by feature_mask or too small for context_size are
+    skipped. Ties resolve to the lowest index.
+
+    Returns:
+        (index, score) of the best model, or (-1, -inf) if none qualify
+    """
+    best_idx = -1
+    best_score = float("-inf")
+
+    for i in range(len(skills)):
+        if not feature_mask[i]:
+            continue
+        window = context_windows[i]
+        if context_size > window:
+            continue
+
+        score = model_score(skills[i], error_rates[i], latencies[i], costs[i],
+                            window, context_size, feature_score, weights)
+        if score > best_score:
+            best_idx = i
+            best_score = score
+
+    return best_idx, best_score
@@ -3,8 +3,9 @@ Router - Selects optimal AI model for each task using scoring functions
 """
 
 from typing import Dict, List, Optional, Tuple
-from ..types import Task, ModelCapability
+from ..types import Task
 from ..registry import CapabilityRegistry
+from ._kernels import score_kernel
 
 
 class Router:
@@ -61,16 +62,25 @@ class Router:
             if override_model in self.registry.capabilities:
                 return override_model
 
-        # Score all available models
-        scores = self._score_models(task, context_size, required_features)
+        # Find highest scoring model in a single pass
+        model_ids, columns = self._model_columns(required_features)
+        best_idx, _ = score_kernel(
+            [cap.skills.get(task.task_type, 0.5) for cap in columns["capabilities"]],
+            columns["error_rates"],
+            columns["latencies"],
+            columns["costs"],
+            columns["context_windows"],
+            context_size,
+            columns["feature_mask"],
+            self._feature_score(required_features),
+            self._weight_vector()
+        )
 
-        if not scores:
+        if best_idx < 0:
             # Fallback to default model
             return self._get_fallback_model(context_size, required_features)
 
-        # Return highest scoring model
-        best_model, best_score = scores[0]
-        return best_model
+        return model_ids[best_idx]
 
     def route_tasks(self, tasks: List[Task], context_sizes: Optional[Dict[str, int]] = None) -> Dict[str, str]:
         """
@@ -86,106 +96,88 @@ class Router:
         assignments = {}
         context_sizes = context_sizes or {}
 
+        # Snapshot task-independent columns once for the whole batch
+        model_ids, columns = self._model_columns(None)
+        capabilities = columns["capabilities"]
+        feature_score = self._feature_score(None)
+        weights = self._weight_vector()
+        skills_by_type: Dict[str, List[float]] = {}
+
         for task in tasks:
+            override_model = self.user_overrides.get(task.task_type)
+            if override_model in self.registry.capabilities:
+                assignments[task.id] = override_model
+                continue
+
+            skills = skills_by_type.get(task.task_type)
+            if skills is None:
+                skills = [cap.skills.get(task.task_type, 0.5) for cap in capabilities]
+                skills_by_type[task.task_type] = skills
+
             context_size = context_sizes.get(task.id, 0)
-            model_id = self.route_task(task, context_size)
-            assignments[task.id] = model_id
+            best_idx, _ = score_kernel(
+                skills,
+                columns["error_rates"],
+                columns["latencies"],
+                columns["costs"],
+                columns["context_windows"],
+                context_size,
+                columns["feature_mask"],
+                feature_score,
+                weights
+            )
+
+            if best_idx < 0:
+                assignments[task.id] = self._get_fallback_model(context_size, None)
+            else:
+                assignments[task.id] = model_ids[best_idx]
 
         return assignments
 
-    def _score_models(self, task: Task, context_size: int,
-                      required_features: Optional[Dict[str, bool]]) -> List[Tuple[str, float]]:
+    def _model_columns(self, required_features: Optional[Dict[str, bool]]) -> Tuple[List[str], Dict[str, list]]:
         """
-        Score all models for a task using weighted scoring function
+        Snapshot registry capabilities as parallel per-model columns
 
         Returns:
-            List of (model_id, score) sorted by score descending
+            (model_ids, columns) where each column is indexed like model_ids
         """
-        scores = []
+        model_ids = list(self.registry.capabilities.keys())
+        capabilities = list(self.registry.capabilities.values())
 
-        for model_id, capability in self.registry.capabilities.items():
-            # Filter by required features
-            if required_features:
-                if required_features.get("vision") and not capability.supports_vision:
-                    continue
-                if required_features.get("streaming") and not capability.supports_streaming:
-                    continue
-                if required_features.get("function_calling") and not capability.supports_function_calling:
-                    continue
-
-            # Filter by context window
-            if context_size > 0 and context_size > capability.context_window:
-                continue
-
-            # Calculate weighted score
-            score = self._calculate_score(task, capability, context_size, required_features)
-            scores.append((model_id, score))
-
-        # Sort by score descending
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores
-
-    def _calculate_score(self, task: Task, capability: ModelCapability,
-                        context_size: int, required_features: Optional[Dict[str, bool]]) -> float:
-        """
-        Calculate weighted score for a model on a task
-
-        Score components:
-        1. Skill match: How well model's skills align with task type
-        2. Performance: Based on error rate and latency
-        3. Cost: Lower cost = higher score
-        4. Context fit: How well context window fits the need
-        5. Features: Bonus for supporting required features
-        """
-        # 1. Skill match score (0-1)
-        skill_score = capability.skills.get(task.task_type, 0.5)
-
-        # 2. Performance score (0-1)
-        # Lower error rate and latency = higher score
-        error_score = 1.0 - capability.error_rate  # 0.95 if 5% error rate
-        latency_score = max(0.0, 1.0 - (capability.avg_latency_ms / 10000))  # Normalize to 10s max
-        performance_score = (error_score * 0.7) + (latency_score * 0.3)
-
-        # 3. Cost score (0-1)
-        # Normalize cost - cheaper is better
-        # Assuming max cost of $0.01 per 1k tokens
-        max_cost = 0.01
-        cost_score = 1.0 - min(capability.cost_per_1k_tokens / max_cost, 1.0)
-
-        # 4. Context fit score (0-1)
-        if context_size == 0:
-            context_score = 1.0  # No context requirement
-        else:
-            utilization = context_size / capability.context_window
-            # Prefer models where context is 20-80% of window (sweet spot)
-            if utilization < 0.2:
-                context_score = 0.8  # Overkill
-            elif utilization < 0.8:
-                context_score = 1.0  # Perfect fit
-            else:
-                context_score = 0.6  # Near limit
-
-        # 5. Features score (0-1)
-        feature_score = 1.0
         if required_features:
-            supported_count = sum([
-                capability.supports_vision if required_features.get("vision") else True,
-                capability.supports_streaming if required_features.get("streaming") else True,
-                capability.supports_function_calling if required_features.get("function_calling") else True
-            ])
-            required_count = sum(required_features.values())
-            feature_score = supported_count / max(required_count, 1)
-
-        # Weighted combination
-        final_score = (
-            self.weights["skill_match"] * skill_score +
-            self.weights["performance"] * performance_score +
-            self.weights["cost"] * cost_score +
-            self.weights["context_fit"] * context_score +
-            self.weights["features"] * feature_score
-        )
+            need_vision = required_features.get("vision")
+            need_streaming = required_features.get("streaming")
+            need_functions = required_features.get("function_calling")
+            feature_mask = [
+                not ((need_vision and not cap.supports_vision) or
+                     (need_streaming and not cap.supports_streaming) or
+                     (need_functions and not cap.supports_function_calling))
+                for cap in capabilities
+            ]
+        else:
+            feature_mask = [True] * len(capabilities)
+
+        return model_ids, {
+            "capabilities": capabilities,
+            "error_rates": [cap.error_rate for cap in capabilities],
+            "latencies": [cap.avg_latency_ms for cap in capabilities],
+            "costs": [cap.cost_per_1k_tokens for cap in capabilities],
+            "context_windows": [cap.context_window for cap in capabilities],
+            "feature_mask": feature_mask
+        }
 
-        return final_score
+    def _weight_vector(self) -> Tuple[float, float, float, float, float]:
+        """Current weights in the order expected by the scoring kernels"""
+        w = self.weights
+        return (w["skill_match"], w["performance"], w["cost"], w["context_fit"], w["features"])
+
+    @staticmethod
+    def _feature_score(required_features: Optional[Dict[str, bool]]) -> float:
+        """Feature score for a model that passed the required-feature filter"""
+        if not required_features:
+            return 1.0
+        # All three features count as supported once the filter has passed
+        return 3 / max(sum(required_features.values()), 1)
 
     def _get_fallback_model(self, context_size: int,
                            required_features: Optional[Dict[str, bool]]) -> str:
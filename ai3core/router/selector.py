@@ -1,5 +1,8 @@
 from typing import Dict, List
-from ai3core.registry.loader import load_registry
+from ai3core.registry.loader import cached_registry
+
+# Divisor turning p50 latency (ms) into a score penalty
+_LATENCY_NORM = 100.0
 
 
 def score_provider(provider: Dict, requirements: Dict, telemetry_stats: Dict) -> float:
@@ -27,14 +30,14 @@ def score_provider(provider: Dict, requirements: Dict, telemetry_stats: Dict) ->
     p50_latency = telemetry_stats.get("p50_latency_ms", 1000.0)
 
     score += 20.0 * success_rate
-    score -= p50_latency / 100.0  # Penalize high latency
+    score -= p50_latency / _LATENCY_NORM  # Penalize high latency
 
     return score
 
 
 def select_provider(task: Dict, telemetry_collector) -> str:
     """Select best provider for task using weighted scoring with telemetry."""
-    registry = load_registry()
+    registry = cached_registry()
     requirements = task.get("requirements", {})
 
     scores = {}
@@ -1,5 +1,8 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
@@ -7,24 +10,75 @@ REGISTRY_DIR = BASE_DIR / "ai3core" / "registry"
 JOURNAL_DIR = BASE_DIR / "runs"
 TELEMETRY_DIR = BASE_DIR / "telemetry"
 
-# Ensure directories exist
-JOURNAL_DIR.mkdir(exist_ok=True)
-TELEMETRY_DIR.mkdir(exist_ok=True)
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-derived runtime settings"""
+    # LLM Planner settings
+    planner_model: str
+    planner_maxtok: int
+    planner_temperature: float
+
+    # Executor settings
+    max_concurrency: int
+    max_concurrency_per_provider: int
+
+    # Verifier settings
+    verify: bool
+    repair_limit: int
+
+    # API settings
+    api_host: str
+    api_port: int
+    cors_origins: List[str]
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Parse settings from the environment once and return the cached result."""
+    return Settings(
+        planner_model=os.getenv("AI3_PLANNER_MODEL", "claude-3-7-sonnet-latest"),
+        planner_maxtok=int(os.getenv("AI3_PLANNER_MAXTOK", "4096")),
+        planner_temperature=float(os.getenv("AI3_PLANNER_TEMPERATURE", "0.0")),
+        max_concurrency=int(os.getenv("AI3_MAX_CONCURRENCY", "5")),
+        max_concurrency_per_provider=int(os.getenv("AI3_MAX_CONCURRENCY_PER_PROVIDER", "3")),
+        verify=os.getenv("AI3_VERIFY", "on").lower() in ("on", "true", "1", "yes"),
+        repair_limit=int(os.getenv("AI3_REPAIR_LIMIT", "1")),
+        api_host=os.getenv("API_HOST", "0.0.0.0"),
+        api_port=int(os.getenv("API_PORT", "8000")),
+        cors_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000").split(","),
+    )
+
+
+_dirs_ready = False
+
+
+def ensure_dirs():
+    """Create journal and telemetry directories (once per process)."""
+    global _dirs_ready
+    if _dirs_ready:
+        return
+    JOURNAL_DIR.mkdir(exist_ok=True)
+    TELEMETRY_DIR.mkdir(exist_ok=True)
+    _dirs_ready = True
+
+
+_settings = get_settings()
 
 # LLM Planner settings
-AI3_PLANNER_MODEL = os.getenv("AI3_PLANNER_MODEL", "claude-3-7-sonnet-latest")
-AI3_PLANNER_MAXTOK = int(os.getenv("AI3_PLANNER_MAXTOK", "4096"))
-AI3_PLANNER_TEMPERATURE = float(os.getenv("AI3_PLANNER_TEMPERATURE", "0.0"))
+AI3_PLANNER_MODEL = _settings.planner_model
+AI3_PLANNER_MAXTOK = _settings.planner_maxtok
+AI3_PLANNER_TEMPERATURE = _settings.planner_temperature
 
 # Executor settings
-AI3_MAX_CONCURRENCY = int(os.getenv("AI3_MAX_CONCURRENCY", "5"))
-AI3_MAX_CONCURRENCY_PER_PROVIDER = int(os.getenv("AI3_MAX_CONCURRENCY_PER_PROVIDER", "3"))
+AI3_MAX_CONCURRENCY = _settings.max_concurrency
+AI3_MAX_CONCURRENCY_PER_PROVIDER = _settings.max_concurrency_per_provider
 
 # Verifier settings
-AI3_VERIFY = os.getenv("AI3_VERIFY", "on").lower() in ("on", "true", "1", "yes")
-AI3_REPAIR_LIMIT = int(os.getenv("AI3_REPAIR_LIMIT", "1"))
+AI3_VERIFY = _settings.verify
+AI3_REPAIR_LIMIT = _settings.repair_limit
 
 # API settings
-API_HOST = os.getenv("API_HOST", "0.0.0.0")
-API_PORT = int(os.getenv("API_PORT", "8000"))
-CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:8000").split(",")
+API_HOST = _settings.api_host
+API_PORT = _settings.api_port
+CORS_ORIGINS = _settings.cors_origins
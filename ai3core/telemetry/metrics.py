@@ -1,71 +1,254 @@
-import json
+import math
+import mmap
+import os
+import time
+from array import array
 from pathlib import Path
-from typing import Dict, List
-from datetime import datetime
-from ai3core.settings import TELEMETRY_DIR
+from typing import Dict, Optional
+from datetime import datetime, timezone
+import orjson
+from ai3core.settings import TELEMETRY_DIR, ensure_dirs
 
 
 class TelemetryCollector:
-    """Collect and persist runtime metrics for router feedback."""
+    """Collect and persist runtime metrics for router feedback.
 
-    def __init__(self):
+    Historical provider stats are persisted as a snapshot (metrics.json)
+    plus an append-only log of task events (metrics.ndjson). Events are
+    buffered and appended in batches; the log is folded back into the
+    snapshot once it grows past compact_bytes. Compaction first rotates the
+    log aside under the snapshot's next generation number, so a crash
+    mid-compaction never replays events the snapshot already holds.
+
+    In memory, provider stats are parallel accumulator columns indexed
+    through _provider_index.
+
+    Per-run stats live in the record returned by start_run(), so one
+    collector can serve concurrent runs; only the historical provider
+    stats and the event log are shared.
+    """
+
+    def __init__(self, max_batch_size: int = 100, flush_interval: float = 5.0,
+                 compact_bytes: int = 8 * 1024 * 1024):
+        ensure_dirs()
         self.metrics_file = TELEMETRY_DIR / "metrics.json"
-        self.current_run = {
-            "tasks": [],
-            "decisions": [],
-            "total_cost": 0.0,
-            "total_tokens": 0
+        self.events_file = TELEMETRY_DIR / "metrics.ndjson"
+        self.max_batch_size = max_batch_size
+        self.flush_interval = flush_interval
+        self.compact_bytes = compact_bytes
+
+        self._pending = self._new_events()  # Task events not yet in the event log
+        self._last_flush = time.monotonic()
+        self._events_fd: Optional[int] = None
+        self._generation = 0  # Number of compactions folded into the snapshot
+
+        # Historical provider stats as columns, one row per provider
+        self._provider_index: Dict[str, int] = {}
+        self._runs = array("q")
+        self._successes = array("q")
+        self._latency_ms = array("d")
+        self._cost = array("d")
+        self._tokens = array("q")
+        self.load_historical()
+
+    @staticmethod
+    def _new_events() -> Dict:
+        """Empty task event buffer; task fields are parallel columns."""
+        return {
+            "task_ids": [],
+            "providers": [],
+            "success": bytearray(),
+            "latency_ms": array("d"),
+            "cost": array("d"),
+            "tokens": array("q"),
+            "timestamp_ns": array("q")  # Epoch nanoseconds, formatted on flush
+        }
+
+    @staticmethod
+    def _new_run() -> Dict:
+        """Empty per-run record holding what finalize_run summarizes."""
+        return {
+            "task_ids": [],
+            "cost": array("d"),
+            "tokens": array("q"),
+            "decisions": []
         }
-        self.historical = self.load_historical()
 
-    def load_historical(self) -> Dict:
-        """Load historical metrics from disk."""
-        if self.metrics_file.exists():
-            with open(self.metrics_file, "r") as f:
-                return json.load(f)
-        return {"provider_stats": {}}
+    def _provider_row(self, provider: str) -> int:
+        """Row index for a provider, appending an empty row if it is new."""
+        i = self._provider_index.get(provider)
+        if i is None:
+            i = self._provider_index[provider] = len(self._runs)
+            self._runs.append(0)
+            self._successes.append(0)
+            self._latency_ms.append(0.0)
+            self._cost.append(0.0)
+            self._tokens.append(0)
+        return i
+
+    def _apply_task(self, provider: str, success: bool, latency_ms: float,
+                    cost: float, tokens: int):
+        """Fold one task result into the historical provider stats."""
+        i = self._provider_row(provider)
+        self._runs[i] += 1
+        if success:
+            self._successes[i] += 1
+        self._latency_ms[i] += latency_ms
+        self._cost[i] += cost
+        self._tokens[i] += int(tokens)
+
+    @property
+    def historical(self) -> Dict:
+        """Historical provider stats in the metrics.json snapshot layout."""
+        return {
+            "provider_stats": {
+                provider: {
+                    "total_runs": self._runs[i],
+                    "successes": self._successes[i],
+                    "total_latency_ms": self._latency_ms[i],
+                    "total_cost": self._cost[i],
+                    "total_tokens": self._tokens[i]
+                }
+                for provider, i in self._provider_index.items()
+            }
+        }
+
+    def load_historical(self):
+        """Load historical metrics from the snapshot and replay the event log."""
+        historical = self._read_snapshot()
+        if historical is not None:
+            self._generation = historical.get("generation", 0)
+            for provider, stats in historical["provider_stats"].items():
+                i = self._provider_row(provider)
+                self._runs[i] = stats["total_runs"]
+                self._successes[i] = stats["successes"]
+                self._latency_ms[i] = stats["total_latency_ms"]
+                self._cost[i] = stats["total_cost"]
+                self._tokens[i] = stats["total_tokens"]
+
+        # A crash mid-compaction leaves the rotated log behind: the current
+        # generation's is already in the snapshot, the next one's is not
+        self._rotated_log(self._generation).unlink(missing_ok=True)
+        self._replay_events(self._rotated_log(self._generation + 1))
+        self._replay_events(self.events_file)
+
+    def _rotated_log(self, generation: int) -> Path:
+        """Path the event log is rotated to while compacting into a generation."""
+        return self.events_file.with_name(f"metrics.{generation}.ndjson")
+
+    def _replay_events(self, path: Path):
+        """Fold the task events of an event log into the historical stats."""
+        if not path.exists():
+            return
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = orjson.loads(line)
+                self._apply_task(event["provider"], event["success"], event["latency_ms"],
+                                 event["cost"], event["tokens"])
+
+    def _read_snapshot(self) -> Optional[Dict]:
+        """Parse metrics.json straight from a read-only mapping of the file."""
+        try:
+            f = open(self.metrics_file, "rb")
+        except FileNotFoundError:
+            return None
+        with f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
 
     def save_historical(self):
-        """Persist historical metrics to disk."""
-        with open(self.metrics_file, "w") as f:
-            json.dump(self.historical, f, indent=2)
+        """Write a full snapshot of historical metrics and discard the event log."""
+        self.flush_events()
+        self._close_events()
+        generation = self._generation + 1
+        rotated = self._rotated_log(generation)
+        if self.events_file.exists():
+            os.replace(self.events_file, rotated)
 
-    def record_task(self, task_id: str, provider: str, success: bool, latency_ms: float, cost: float, tokens: int):
-        """Record task execution metrics."""
-        self.current_run["tasks"].append({
-            "task_id": task_id,
-            "provider": provider,
-            "success": success,
-            "latency_ms": latency_ms,
-            "cost": cost,
-            "tokens": tokens,
-            "timestamp": datetime.utcnow().isoformat()
-        })
+        # Write to a temp file and rename over the snapshot so a crash can't leave it torn
+        tmp = self.metrics_file.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps({"generation": generation, **self.historical}, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.metrics_file)
+        self._generation = generation
+        rotated.unlink(missing_ok=True)
+
+    def flush_events(self):
+        """Append all buffered task events to the event log in one write."""
+        self._last_flush = time.monotonic()
+        events = self._pending
+        if not events["task_ids"]:
+            return
+
+        rows = zip(events["task_ids"], events["providers"], events["success"],
+                   events["latency_ms"], events["cost"], events["tokens"],
+                   events["timestamp_ns"])
+        data = b"".join(
+            orjson.dumps({
+                "task_id": task_id,
+                "provider": provider,
+                "success": bool(success),
+                "latency_ms": latency_ms,
+                "cost": cost,
+                "tokens": tokens,
+                "timestamp": datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+            }) + b"\n"
+            for task_id, provider, success, latency_ms, cost, tokens, ts_ns in rows
+        )
+        self._pending = self._new_events()
+
+        if self._events_fd is None:
+            self._events_fd = os.open(self.events_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.write(self._events_fd, data)
+
+    def _close_events(self):
+        if self._events_fd is not None:
+            os.close(self._events_fd)
+            self._events_fd = None
+
+    def close(self):
+        """Flush buffered events and release the event log."""
+        self.flush_events()
+        self._close_events()
 
-        self.current_run["total_cost"] += cost
-        self.current_run["total_tokens"] += tokens
+    def start_run(self) -> Dict:
+        """Begin a new run and return its record for record_task/finalize_run."""
+        return self._new_run()
+
+    def record_task(self, run: Dict, task_id: str, provider: str, success: bool,
+                    latency_ms: float, cost: float, tokens: int):
+        """Record task execution metrics against a run from start_run()."""
+        run["task_ids"].append(task_id)
+        run["cost"].append(cost)
+        run["tokens"].append(int(tokens))
+
+        events = self._pending
+        events["task_ids"].append(task_id)
+        events["providers"].append(provider)
+        events["success"].append(1 if success else 0)
+        events["latency_ms"].append(latency_ms)
+        events["cost"].append(cost)
+        events["tokens"].append(int(tokens))
+        events["timestamp_ns"].append(time.time_ns())
 
         # Update historical provider stats
-        if provider not in self.historical["provider_stats"]:
-            self.historical["provider_stats"][provider] = {
-                "total_runs": 0,
-                "successes": 0,
-                "total_latency_ms": 0.0,
-                "total_cost": 0.0,
-                "total_tokens": 0
-            }
+        self._apply_task(provider, success, latency_ms, cost, tokens)
 
-        stats = self.historical["provider_stats"][provider]
-        stats["total_runs"] += 1
-        if success:
-            stats["successes"] += 1
-        stats["total_latency_ms"] += latency_ms
-        stats["total_cost"] += cost
-        stats["total_tokens"] += tokens
-
-    def record_decision(self, task_id: str, chosen_provider: str, score: float):
-        """Record routing decision."""
-        self.current_run["decisions"].append({
+        # Write out to the event log once the batch is full or stale
+        if (len(events["task_ids"]) >= self.max_batch_size or
+                time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush_events()
+
+    def record_decision(self, run: Dict, task_id: str, chosen_provider: str, score: float):
+        """Record routing decision against a run from start_run()."""
+        run["decisions"].append({
             "task_id": task_id,
             "chosen_provider": chosen_provider,
             "score": score
@@ -73,31 +256,44 @@ class TelemetryCollector:
 
     def get_provider_stats(self, provider: str) -> Dict:
         """Get rolling stats for a provider."""
-        if provider not in self.historical["provider_stats"]:
+        i = self._provider_index.get(provider)
+        if i is None:
             return {
                 "success_rate": 0.5,
                 "p50_latency_ms": 1000.0,
                 "avg_cost": 0.001
             }
 
-        stats = self.historical["provider_stats"][provider]
-        success_rate = stats["successes"] / max(stats["total_runs"], 1)
-        p50_latency = stats["total_latency_ms"] / max(stats["total_runs"], 1)
-        avg_cost = stats["total_cost"] / max(stats["total_runs"], 1)
+        runs = max(self._runs[i], 1)
+        return {
+            "success_rate": self._successes[i] / runs,
+            "p50_latency_ms": self._latency_ms[i] / runs,
+            "avg_cost": self._cost[i] / runs
+        }
 
+    def provider_summaries(self) -> Dict[str, Dict]:
+        """Rolling stats for every known provider in one pass over the columns."""
         return {
-            "success_rate": success_rate,
-            "p50_latency_ms": p50_latency,
-            "avg_cost": avg_cost
+            provider: {
+                "success_rate": succ / max(runs, 1),
+                "p50_latency_ms": lat / max(runs, 1),
+                "avg_cost": cost / max(runs, 1)
+            }
+            for provider, runs, succ, lat, cost in zip(
+                self._provider_index, self._runs, self._successes, self._latency_ms, self._cost
+            )
         }
 
-    def finalize_run(self) -> Dict:
-        """Finalize current run and save metrics."""
-        self.save_historical()
+    def finalize_run(self, run: Dict) -> Dict:
+        """Finalize a run from start_run() and persist metrics."""
+        self.flush_events()
+        if self.events_file.exists() and self.events_file.stat().st_size > self.compact_bytes:
+            self.save_historical()
+
         run_summary = {
-            "task_count": len(self.current_run["tasks"]),
-            "decision_count": len(self.current_run["decisions"]),
-            "total_cost": self.current_run["total_cost"],
-            "total_tokens": self.current_run["total_tokens"]
+            "task_count": len(run["task_ids"]),
+            "decision_count": len(run["decisions"]),
+            "total_cost": math.fsum(run["cost"]),
+            "total_tokens": sum(run["tokens"])
         }
         return run_summary
@@ -24,7 +24,13 @@ class ModelProvider(Enum):
     XAI = "xai"
 
 
-@dataclass
+# Record types use slots but are deliberately not frozen: a frozen __init__
+# assigns each field through object.__setattr__ (about 5x slower to build),
+# slotted attribute reads cost the same either way, and the list/dict fields
+# would make instances unhashable regardless
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a single task in the plan"""
     id: str
@@ -38,7 +44,7 @@ class Task:
     priority: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskGraph:
     """Directed Acyclic Graph of tasks"""
     tasks: Dict[str, Task]
@@ -46,7 +52,7 @@ class TaskGraph:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelCapability:
     """Capabilities and metrics for a specific model"""
     model_id: str
@@ -63,7 +69,7 @@ class ModelCapability:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionArtifact:
     """Result artifact from a task execution"""
     task_id: str
@@ -79,7 +85,7 @@ class ExecutionArtifact:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationResult:
     """Result of quality verification"""
     artifact_id: str
@@ -91,7 +97,7 @@ class VerificationResult:
     suggested_fixes: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AssembledResponse:
     """Final assembled response from multiple artifacts"""
     content: str
@@ -101,7 +107,7 @@ class AssembledResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class RunTrace:
     """Complete execution trace for a run"""
     run_id: str
@@ -2,11 +2,30 @@
 Verifier - Validates output quality against success criteria
 """
 
+import math
 import re
-from typing import List, Dict, Optional, Callable
+import threading
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from hashlib import blake2b
+from typing import List, Dict, Optional, Callable, Set, Tuple
 from ..types import ExecutionArtifact, VerificationResult, Task
 
 
+@lru_cache(maxsize=256)
+def _criterion_kind(criterion: str) -> Tuple[bool, bool, bool]:
+    """Classify a success criterion as (completion, verification, fix) checks"""
+    criterion_lower = criterion.lower()
+    return (
+        any(phrase in criterion_lower for phrase in ("complete", "success", "valid")),
+        "test" in criterion_lower or "verify" in criterion_lower,
+        "error" in criterion_lower or "bug" in criterion_lower or "fix" in criterion_lower
+    )
+
+
 class Verifier:
     """
     Quality verification engine
@@ -29,6 +48,38 @@ class Verifier:
     PASS_THRESHOLD = 0.7
     REPAIR_THRESHOLD = 0.5
 
+    # Empty/placeholder responses
+    _PLACEHOLDER_RE = re.compile(
+        r"^(todo|tbd|coming soon|not implemented|\.\.\.|…|error|failed|unable)$", re.IGNORECASE
+    )
+    _PLACEHOLDER_MAX_LEN = len("not implemented")
+    _NON_SPACE_RE = re.compile(r"\S")
+
+    # Phrases indicating the model failed or refused
+    FAILURE_PATTERNS = (
+        "i cannot",
+        "i can't",
+        "unable to",
+        "don't have access",
+        "not possible",
+        "error occurred",
+        "failed to",
+        "couldn't",
+        "insufficient information",
+        "apologize"
+    )
+
+    # Evidence keywords looked for by success criteria
+    KEYWORD_GROUPS = {
+        "failure": FAILURE_PATTERNS,
+        "completion": ("done", "completed", "successfully", "finished"),
+        "verification": ("tested", "verified", "validated", "passed"),
+        "fix": ("fixed", "resolved", "corrected", "solved"),
+    }
+
+    # Maximum number of memoized verification results
+    CACHE_SIZE = 1024
+
     def __init__(self, custom_validators: Optional[Dict[str, Callable]] = None):
         """
         Initialize the verifier
@@ -38,6 +89,12 @@ class Verifier:
         """
         self.custom_validators = custom_validators or {}
 
+        # LRU of content hash -> result, for repair loops re-verifying the same output
+        self._verify_cache: "OrderedDict[bytes, VerificationResult]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache_lock = threading.Lock()  # batch_verify calls verify from worker threads
+
     def verify(self, artifact: ExecutionArtifact, task: Task) -> VerificationResult:
         """
         Verify an artifact against task requirements
@@ -61,34 +118,98 @@ class Verifier:
                 suggested_fixes=["Retry with different model", "Check input parameters"]
             )
 
+        # Custom validators may look at anything, so their results are not memoized
+        if task.task_type in self.custom_validators:
+            return self._verify_artifact(artifact, task)
+
+        key = self._cache_key(artifact, task)
+        with self._cache_lock:
+            cached = self._verify_cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                self._verify_cache.move_to_end(key)
+            else:
+                self.cache_misses += 1
+        if cached is not None:
+            return replace(
+                cached,
+                artifact_id=f"{artifact.task_id}:{artifact.model_id}",
+                criteria_results=dict(cached.criteria_results),
+                suggested_fixes=list(cached.suggested_fixes)
+            )
+
+        result = self._verify_artifact(artifact, task)
+        with self._cache_lock:
+            self._verify_cache[key] = result
+            if len(self._verify_cache) > self.CACHE_SIZE:
+                self._verify_cache.popitem(last=False)
+        return replace(
+            result,
+            criteria_results=dict(result.criteria_results),
+            suggested_fixes=list(result.suggested_fixes)
+        )
+
+    @staticmethod
+    def _cache_key(artifact: ExecutionArtifact, task: Task) -> bytes:
+        """Hash of everything the built-in checks depend on"""
+        h = blake2b(digest_size=16)
+        h.update(task.id.encode())
+        h.update(b"\0")
+        h.update("\0".join(task.success_criteria).encode())
+        h.update(b"\0")
+        h.update(str(artifact.token_usage.get("output", 0)).encode())
+        h.update(b"\0")
+        h.update(artifact.response.encode())
+        return h.digest()
+
+    def cache_stats(self) -> Dict[str, float]:
+        """Memoization hit/miss counters"""
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_ratio": self.cache_hits / lookups if lookups else 0.0,
+            "size": len(self._verify_cache)
+        }
+
+    def _verify_artifact(self, artifact: ExecutionArtifact, task: Task) -> VerificationResult:
+        """Run the full verification pipeline on a successful artifact"""
         # Run validation checks
         criteria_results = {}
-        scores = []
+        has_custom = task.task_type in self.custom_validators
+        # basic + each criterion + optional custom + failure patterns
+        n_scores = 2 + len(task.success_criteria) + has_custom
+        scores = array("d", bytes(8 * n_scores))
+        idx = 0
+        hits = self._scan_keywords(artifact.response)
 
         # 1. Check basic quality
         basic_score, basic_result = self._check_basic_quality(artifact)
         criteria_results["basic_quality"] = basic_result
-        scores.append(basic_score)
+        scores[idx] = basic_score
+        idx += 1
 
         # 2. Check against explicit success criteria
         for criterion in task.success_criteria:
-            score, result = self._check_criterion(artifact, criterion)
+            score, result = self._check_criterion(artifact, criterion, hits)
             criteria_results[criterion] = result
-            scores.append(score)
+            scores[idx] = score
+            idx += 1
 
         # 3. Run task-type specific validation
-        if task.task_type in self.custom_validators:
+        if has_custom:
             custom_score, custom_result = self.custom_validators[task.task_type](artifact, task)
             criteria_results["custom_validation"] = custom_result
-            scores.append(custom_score)
+            scores[idx] = custom_score
+            idx += 1
 
         # 4. Check for common failure patterns
-        failure_score, failure_result = self._check_failure_patterns(artifact)
+        failure_score, failure_result = self._check_failure_patterns(artifact, hits)
         criteria_results["failure_patterns"] = failure_result
-        scores.append(failure_score)
+        scores[idx] = failure_score
 
         # Calculate overall score
-        overall_score = sum(scores) / len(scores) if scores else 0.0
+        overall_score = math.fsum(scores) / n_scores
 
         # Determine pass/fail
         passed = overall_score >= self.PASS_THRESHOLD
@@ -119,22 +240,21 @@ class Verifier:
         Returns:
             (score, passed) tuple
         """
-        response = artifact.response.strip()
+        # Bounds of the stripped response, found without copying or case-folding it
+        response = artifact.response
+        first = self._NON_SPACE_RE.search(response)
+        start = first.start() if first else len(response)
+        end = len(response)
+        while end > start and response[end - 1].isspace():
+            end -= 1
 
         # Check minimum length
-        if len(response) < self.MIN_RESPONSE_LENGTH:
+        if end - start < self.MIN_RESPONSE_LENGTH:
             return 0.0, False
 
-        # Check for empty/placeholder responses
-        placeholder_patterns = [
-            r"^(todo|tbd|coming soon|not implemented)$",
-            r"^(\.\.\.|…)$",
-            r"^(error|failed|unable)$"
-        ]
-
-        for pattern in placeholder_patterns:
-            if re.match(pattern, response.lower()):
-                return 0.2, False
+        # Check for empty/placeholder responses (only short ones can match)
+        if end - start <= self._PLACEHOLDER_MAX_LEN and self._PLACEHOLDER_RE.match(response[start:end]):
+            return 0.2, False
 
         # Check token efficiency (not too short for the latency)
         output_tokens = artifact.token_usage.get("output", 0)
@@ -143,35 +263,53 @@ class Verifier:
 
         return 1.0, True
 
-    def _check_criterion(self, artifact: ExecutionArtifact, criterion: str) -> tuple:
+    def _scan_keywords(self, response: str) -> Dict[str, Set[str]]:
+        """
+        Find all evidence keywords in a response, lowercasing it only once
+
+        Returns:
+            Dict mapping keyword group -> distinct keywords found
+        """
+        response_lower = response.lower()
+        return {
+            group: {keyword for keyword in keywords if keyword in response_lower}
+            for group, keywords in self.KEYWORD_GROUPS.items()
+        }
+
+    def _check_criterion(self, artifact: ExecutionArtifact, criterion: str,
+                         hits: Optional[Dict[str, Set[str]]] = None) -> tuple:
         """
         Check a specific success criterion
 
+        Args:
+            artifact: Artifact being verified
+            criterion: Success criterion text
+            hits: Keyword scan of the response, computed if not given
+
         Returns:
             (score, passed) tuple
         """
-        response = artifact.response.lower()
-        criterion_lower = criterion.lower()
+        if hits is None:
+            hits = self._scan_keywords(artifact.response)
 
         # Simple keyword matching for now
         # Can be enhanced with semantic similarity
+        wants_completion, wants_verification, wants_fix = _criterion_kind(criterion)
 
         # Check for explicit success phrases
-        if any(phrase in criterion_lower for phrase in ["complete", "success", "valid"]):
-            # Look for completion indicators
-            if any(indicator in response for indicator in ["done", "completed", "successfully", "finished"]):
-                return 1.0, True
+        if wants_completion and hits["completion"]:
+            return 1.0, True
 
         # Check for specific requirements
-        if "test" in criterion_lower or "verify" in criterion_lower:
+        if wants_verification:
             # Look for validation evidence
-            if any(word in response for word in ["tested", "verified", "validated", "passed"]):
+            if hits["verification"]:
                 return 1.0, True
             return 0.5, False
 
-        if "error" in criterion_lower or "bug" in criterion_lower or "fix" in criterion_lower:
+        if wants_fix:
             # Look for resolution evidence
-            if any(word in response for word in ["fixed", "resolved", "corrected", "solved"]):
+            if hits["fix"]:
                 return 1.0, True
             return 0.5, False
 
@@ -181,30 +319,23 @@ class Verifier:
 
         return 0.6, True
 
-    def _check_failure_patterns(self, artifact: ExecutionArtifact) -> tuple:
+    def _check_failure_patterns(self, artifact: ExecutionArtifact,
+                                hits: Optional[Dict[str, Set[str]]] = None) -> tuple:
         """
         Check for common failure patterns in response
 
+        Args:
+            artifact: Artifact being verified
+            hits: Keyword scan of the response, computed if not given
+
         Returns:
             (score, passed) tuple
         """
-        response = artifact.response.lower()
-
-        failure_patterns = [
-            "i cannot",
-            "i can't",
-            "unable to",
-            "don't have access",
-            "not possible",
-            "error occurred",
-            "failed to",
-            "couldn't",
-            "insufficient information",
-            "apologize"
-        ]
-
-        # Count failure indicators
-        failure_count = sum(1 for pattern in failure_patterns if pattern in response)
+        if hits is None:
+            hits = self._scan_keywords(artifact.response)
+
+        # Count distinct failure indicators
+        failure_count = len(hits["failure"])
 
         if failure_count >= 3:
             return 0.0, False
@@ -268,28 +399,34 @@ class Verifier:
         return fixes
 
     def batch_verify(self, artifacts: List[ExecutionArtifact],
-                    tasks: Dict[str, Task]) -> Dict[str, VerificationResult]:
+                    tasks: Dict[str, Task],
+                    max_workers: Optional[int] = None) -> Dict[str, VerificationResult]:
         """
-        Verify multiple artifacts
+        Verify multiple artifacts concurrently
 
         Args:
             artifacts: List of artifacts to verify
             tasks: Dict mapping task_id -> Task
+            max_workers: Thread pool size (default: min(32, number of artifacts))
 
         Returns:
             Dict mapping artifact_id -> VerificationResult
         """
-        results = {}
-
-        for artifact in artifacts:
-            task = tasks.get(artifact.task_id)
-            if not task:
-                continue
+        pairs = [(artifact, tasks[artifact.task_id]) for artifact in artifacts
+                 if tasks.get(artifact.task_id)]
+        if not pairs:
+            return {}
 
-            result = self.verify(artifact, task)
-            results[result.artifact_id] = result
+        if len(pairs) == 1:
+            verified = [self.verify(*pairs[0])]
+        else:
+            workers = max_workers or min(32, len(pairs))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(self.verify, artifact, task) for artifact, task in pairs]
+                verified = [future.result() for future in futures]
 
-        return results
+        # Collect in submission order so duplicate artifact ids resolve as before
+        return {result.artifact_id: result for result in verified}
 
     def get_repair_tasks(self, verification: VerificationResult,
                         original_task: Task) -> List[Task]:
@@ -1,7 +1,57 @@
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, Optional
 from ai3core.settings import AI3_VERIFY, AI3_REPAIR_LIMIT
 
 
+# Shared read-only default for missing meta/verification dicts
+_EMPTY = MappingProxyType({})
+
+
+def _check_non_empty(content: str) -> Optional[str]:
+    return "Content is empty" if not content.strip() else None
+
+
+def _check_min_length_100(content: str) -> Optional[str]:
+    return "Content too short (< 100 chars)" if len(content) < 100 else None
+
+
+def _check_coherent(content: str) -> Optional[str]:
+    return "Content lacks coherence (< 10 words)" if len(content.split()) < 10 else None
+
+
+# Supported criteria (matched case-insensitively) -> checker returning a failure message or None
+_CRITERION_CHECKS: Dict[str, Callable[[str], Optional[str]]] = {
+    "non-empty": _check_non_empty,
+    "min-length-100": _check_min_length_100,
+    "coherent": _check_coherent,
+}
+
+
+@lru_cache(maxsize=128)
+def _compile_criterion(criterion: str) -> Optional[Callable[[str], Optional[str]]]:
+    """Resolve a criterion string to its checker once; None for criteria we don't check."""
+    return _CRITERION_CHECKS.get(criterion.lower())
+
+
+def _check(criterion: str, content: str) -> Optional[str]:
+    """Return the failure message if content fails the criterion, else None."""
+    check = _compile_criterion(criterion)
+    return check(content) if check is not None else None
+
+
+def verify_artifact_quick(artifact: Dict, quality_criteria: list) -> bool:
+    """
+    Return whether the artifact meets all quality_criteria.
+    Stops at the first failure and leaves the artifact untouched; use
+    verify_artifact when failure feedback or repair bookkeeping is needed.
+    """
+    if not AI3_VERIFY:
+        return True
+    content = artifact.get("content", "")
+    return all(_check(criterion, content) is None for criterion in quality_criteria)
+
+
 async def verify_artifact(artifact: Dict, quality_criteria: list, executor_fn) -> Dict:
     """
     Verify artifact against quality_criteria.
@@ -14,15 +64,10 @@ async def verify_artifact(artifact: Dict, quality_criteria: list, executor_fn) -
 
     # Simple heuristic verification
     content = artifact.get("content", "")
-    failures = []
-
-    for criterion in quality_criteria:
-        if criterion.lower() == "non-empty" and not content.strip():
-            failures.append("Content is empty")
-        elif criterion.lower() == "min-length-100" and len(content) < 100:
-            failures.append("Content too short (< 100 chars)")
-        elif criterion.lower() == "coherent" and len(content.split()) < 10:
-            failures.append("Content lacks coherence (< 10 words)")
+    failures = [
+        failure for failure in (_check(criterion, content) for criterion in quality_criteria)
+        if failure is not None
+    ]
 
     if not failures:
         artifact["meta"]["verification"] = {
@@ -54,15 +99,15 @@ async def verify_artifact(artifact: Dict, quality_criteria: list, executor_fn) -
 
 def should_repair(artifact: Dict) -> bool:
     """Check if artifact needs repair."""
-    verification = artifact.get("meta", {}).get("verification", {})
+    meta = artifact.get("meta", _EMPTY)
+    verification = meta.get("verification", _EMPTY)
     return (
         verification.get("status") == "failed" and
         verification.get("repair_attempted") and
-        artifact["meta"].get("repair_count", 0) <= AI3_REPAIR_LIMIT
+        meta.get("repair_count", 0) <= AI3_REPAIR_LIMIT
     )
 
 
 def should_fallback(artifact: Dict) -> bool:
     """Check if artifact needs fallback to next-best model."""
-    verification = artifact.get("meta", {}).get("verification", {})
-    return verification.get("fallback_recommended", False)
+    return artifact.get("meta", _EMPTY).get("verification", _EMPTY).get("fallback_recommended", False)
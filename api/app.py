@@ -1,14 +1,23 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import asyncio
-import json
+import orjson
 from ai3core.engine import Ai3Core
 from ai3core.settings import CORS_ORIGINS
 
 
-app = FastAPI(title="Ai3 Orchestrator API v2.1")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build one engine for the app's lifetime and share it across requests."""
+    app.state.engine = Ai3Core()
+    yield
+    await app.state.engine.aclose()
+
+
+app = FastAPI(title="Ai3 Orchestrator API v2.1", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,54 +28,56 @@ app.add_middleware(
 )
 
 
+# Maximum number of events coalesced into one SSE frame
+SSE_BATCH_SIZE = 32
+
+
 class RunRequest(BaseModel):
     prompt: str
 
 
 @app.post("/run")
-async def run_non_streaming(request: RunRequest):
+async def run_non_streaming(request: RunRequest, http_request: Request):
     """Non-streaming orchestration endpoint."""
-    engine = Ai3Core()
+    engine = http_request.app.state.engine
     result = await engine.run(request.prompt, stream=False)
     return result
 
 
 @app.post("/stream/run")
-async def run_streaming(request: RunRequest):
+async def run_streaming(request: RunRequest, http_request: Request):
     """Server-Sent Events streaming endpoint."""
-    engine = Ai3Core()
+    engine = http_request.app.state.engine
 
     async def event_generator():
-        events = []
-
-        async def collect_event(event: dict):
-            events.append(event)
-
-        # Run orchestration with event collection
-        task = asyncio.create_task(engine.run(request.prompt, stream=True))
-
-        # Mock event stream for demonstration
-        # In production, engine.run would yield events via callback
-        await asyncio.sleep(0.1)
-
-        # Emit sample events
-        sample_events = [
-            {"type": "plan", "status": "started"},
-            {"type": "plan", "status": "completed", "task_count": 3},
-            {"type": "task_start", "task_id": "t1", "description": "Generate introduction"},
-            {"type": "decision", "task_id": "t1", "provider": "anthropic-claude"},
-            {"type": "task_artifact", "task_id": "t1", "artifact": {"content": "Sample intro"}},
-            {"type": "task_verified", "task_id": "t1", "verification": {"status": "passed"}},
-            {"type": "assemble_start"},
-            {"type": "final", "output": "Final assembled output"},
-            {"type": "stats", "stats": {"task_count": 3, "total_cost": 0.05}}
-        ]
-
-        for event in sample_events:
-            yield f"data: {json.dumps(event)}\n\n"
-            await asyncio.sleep(0.2)
-
-        yield "data: [DONE]\n\n"
+        queue: asyncio.Queue = asyncio.Queue()
+
+        # Run orchestration, receiving events as they happen
+        task = asyncio.create_task(engine.run(request.prompt, stream=True, on_event=queue.put_nowait))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+
+        try:
+            done = False
+            while not done:
+                # Coalesce whatever is already queued into one frame
+                batch = [await queue.get()]
+                while not queue.empty() and len(batch) < SSE_BATCH_SIZE:
+                    batch.append(queue.get_nowait())
+                if batch[-1] is None:
+                    done = True
+                    batch.pop()
+                if batch:
+                    yield b"data: " + orjson.dumps(batch) + b"\n\n"
+        finally:
+            # Stop the run if the client disconnected mid-stream
+            if not task.done():
+                task.cancel()
+
+        # A failed run has already emitted an error event; just consume the exception
+        if not task.cancelled():
+            task.exception()
+
+        yield b"data: [DONE]\n\n"
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -2,7 +2,9 @@
 API Client Wrappers - Interfaces for different AI model APIs
 """
 
-import requests
+import httpx
+import random
+import threading
 import time
 import logging
 from typing import Optional
@@ -12,30 +14,126 @@ import openai
 logger = logging.getLogger(__name__)
 
 
+# Default timeout of the Anthropic and OpenAI SDKs; they adopt the timeout of a
+# client passed to them, so the shared pool must not shorten it. Grok sets its
+# own 60s timeout per request.
+_SDK_DEFAULT_TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
+
+def make_http_client(pool_size: int = 32) -> httpx.Client:
+    """Create a keep-alive connection pool that API clients can share"""
+    return httpx.Client(
+        timeout=_SDK_DEFAULT_TIMEOUT,
+        limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    )
+
+
+# Constant wrapper for Grok prompt refinement; identical bytes on every call
+# also let the provider reuse its prompt cache for the prefix
+_REFINE_PREFIX = """As an expert prompt engineer, refine the following prompt to be more specific, detailed, and effective for a coding task. Focus on:
+- Clarifying requirements and constraints
+- Specifying desired code structure and best practices
+- Adding relevant technical details
+- Making success criteria explicit
+
+Original prompt:
+"""
+_REFINE_SUFFIX = """
+
+Provide ONLY the refined prompt, without any explanation or meta-commentary."""
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the client's circuit is open"""
+
+
+class CircuitBreaker:
+    """Fail fast after repeated consecutive failures
+
+    After fail_max consecutive failures the circuit opens and calls are
+    rejected until reset_timeout has passed. The circuit is then half-open:
+    the next call is let through as a single trial while other calls are
+    still rejected, and the trial's outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raise CircuitOpenError if calls are currently being rejected"""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("Circuit open after repeated failures")
+            # Half-open: let this call through as the only trial
+            self._trial_in_flight = True
+
+    def record_success(self):
+        """Close the circuit after a successful call"""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def release_trial(self):
+        """Let another trial through after one ended without an outcome"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """Count a failure, opening the circuit at fail_max or on a failed trial"""
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or self._failures >= self.fail_max:
+                self._trial_in_flight = False
+                self._opened_at = time.monotonic()
+
+
 class BaseAPIClient:
     """Base class for API clients with retry logic"""
 
+    # Backoff before retry n is uniform in [0, min(BACKOFF_MAX, BACKOFF_BASE * 2**n)]
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 8.0
+
     def __init__(self, api_key: str, max_retries: int = 3):
         self.api_key = api_key
         self.max_retries = max_retries
+        self._breaker = CircuitBreaker(fail_max=5, reset_timeout=30.0)
 
     def _retry_request(self, func, *args, **kwargs):
         """Retry logic for API requests"""
         for attempt in range(self.max_retries):
+            self._breaker.before_call()
             try:
-                return func(*args, **kwargs)
+                result = func(*args, **kwargs)
             except Exception as e:
-                logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
+                self._breaker.record_failure()
+                logger.warning("Attempt %d failed: %s", attempt + 1, e)
                 if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    # Exponential backoff with full jitter to spread out retries
+                    time.sleep(random.uniform(0, min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2 ** attempt)))
                 else:
                     raise
+            except BaseException:
+                # Interrupted (e.g. KeyboardInterrupt); don't leave a trial stuck in flight
+                self._breaker.release_trial()
+                raise
+            else:
+                self._breaker.record_success()
+                return result
 
 
 class GrokClient(BaseAPIClient):
     """Client for xAI Grok API"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.Client] = None):
         super().__init__(api_key)
         self.base_url = "https://api.x.ai/v1"
         self.headers = {
@@ -43,10 +141,19 @@ class GrokClient(BaseAPIClient):
             "Content-Type": "application/json"
         }
 
+        # Persistent keep-alive pool so calls skip the TCP+TLS handshake
+        self._owns_http = http_client is None
+        self.http = http_client or make_http_client()
+
+    def close(self):
+        """Close pooled connections (unless the pool is shared)"""
+        if self._owns_http:
+            self.http.close()
+
     def complete(self, prompt: str, max_tokens: int = 2000) -> str:
         """Get completion from Grok"""
         def _request():
-            response = requests.post(
+            response = self.http.post(
                 f"{self.base_url}/chat/completions",
                 headers=self.headers,
                 json={
@@ -64,26 +171,15 @@ class GrokClient(BaseAPIClient):
 
     def refine_prompt(self, original_prompt: str) -> str:
         """Use Grok to refine/enhance a prompt for coding tasks"""
-        refinement_request = f"""As an expert prompt engineer, refine the following prompt to be more specific, detailed, and effective for a coding task. Focus on:
-- Clarifying requirements and constraints
-- Specifying desired code structure and best practices
-- Adding relevant technical details
-- Making success criteria explicit
-
-Original prompt:
-{original_prompt}
-
-Provide ONLY the refined prompt, without any explanation or meta-commentary."""
-
-        return self.complete(refinement_request, max_tokens=1000)
+        return self.complete(_REFINE_PREFIX + original_prompt + _REFINE_SUFFIX, max_tokens=1000)
 
 
 class ClaudeClient(BaseAPIClient):
     """Client for Anthropic Claude API"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.Client] = None):
         super().__init__(api_key)
-        self.client = Anthropic(api_key=api_key)
+        self.client = Anthropic(api_key=api_key, http_client=http_client)
 
     def complete(self, prompt: str, max_tokens: int = 4000) -> str:
         """Get completion from Claude"""
@@ -101,9 +197,9 @@ class ClaudeClient(BaseAPIClient):
 class ChatGPTClient(BaseAPIClient):
     """Client for OpenAI ChatGPT API"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, http_client: Optional[httpx.Client] = None):
         super().__init__(api_key)
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = openai.OpenAI(api_key=api_key, http_client=http_client)
 
     def complete(self, prompt: str, max_tokens: int = 2000) -> str:
         """Get completion from ChatGPT"""
@@ -4,15 +4,24 @@ Configuration Management
 
 import json
 import os
-from typing import Dict, Any
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional
 
 
 class Config:
     """Manages configuration for task routing and system settings"""
 
+    # Seconds to wait for further updates before writing rules to disk
+    SAVE_DELAY = 1.0
+
     def __init__(self, config_path: str = "task_rules.json"):
         self.config_path = config_path
         self.rules = self._load_rules()
+        # Read-only live view of the routing table, resolved once
+        self._routing = MappingProxyType(self.rules['routing_rules'])
+        self._save_timer: Optional[threading.Timer] = None
+        self._save_lock = threading.Lock()
 
     def _load_rules(self) -> Dict[str, Any]:
         """Load task routing rules from JSON file"""
@@ -45,12 +54,29 @@ class Config:
 
     def get_routing_rule(self, task_type: str) -> str:
         """Get routing rule for a specific task type"""
-        return self.rules['routing_rules'].get(task_type, 'grok')
+        return self._routing.get(task_type, 'grok')
 
     def update_routing_rule(self, task_type: str, rule: str):
-        """Update routing rule for a task type"""
-        self.rules['routing_rules'][task_type] = rule
-        self._save_rules(self.rules)
+        """Update routing rule for a task type
+
+        The write to disk is deferred by SAVE_DELAY so a burst of updates
+        produces a single save; call flush() to write immediately.
+        """
+        with self._save_lock:
+            self.rules['routing_rules'][task_type] = rule
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.start()
+
+    def flush(self):
+        """Write any pending rule updates to disk"""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            self._save_rules(self.rules)
 
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Get a setting value"""
@@ -6,43 +6,118 @@ Coordinates multiple AI models based on task analysis
 import os
 import sys
 import json
+import atexit
 import logging
-from typing import Dict, List, Any
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 
 from task_analyzer import TaskAnalyzer
-from api_clients import GrokClient, ClaudeClient, ChatGPTClient
+from api_clients import GrokClient, ClaudeClient, ChatGPTClient, make_http_client
 from config import Config
+from response_cache import ResponseCache
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('orchestrator.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Log calls only enqueue records; a listener thread does the file/console I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [
+    logging.FileHandler('orchestrator.log'),
+    logging.StreamHandler(sys.stdout)
+]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, *_log_handlers)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drain pending records on exit
+
 logger = logging.getLogger(__name__)
 
+# Wrapper for answering several tasks routed to the same model in one call
+_BATCH_PROMPT_HEADER = "Complete each of the following independent tasks.\n\n"
+_BATCH_PROMPT_FOOTER = (
+    "Respond with ONLY a JSON object that maps each task number (as a string) "
+    "to the complete response for that task, e.g. {\"1\": \"...\", \"2\": \"...\"}."
+)
+
 
 class AIOrchestrator:
     """Main orchestrator class that manages AI model interactions"""
 
+    # Upper bound on concurrent model calls for one prompt
+    MAX_PARALLEL_TASKS = 8
+
+    # Single-model routes whose tasks may be answered together in one call
+    BATCHABLE_RULES = frozenset({"claude", "chatgpt", "grok"})
+
     def __init__(self):
         load_dotenv()
         self.config = Config()
 
-        # Initialize AI clients
-        self.grok_client = GrokClient(os.getenv('XAI_API_KEY'))
-        self.claude_client = ClaudeClient(os.getenv('ANTHROPIC_API_KEY'))
-        self.chatgpt_client = ChatGPTClient(os.getenv('OPENAI_API_KEY'))
-
         # Initialize task analyzer
         self.task_analyzer = TaskAnalyzer()
 
+        # Successful responses, reused for repeated tasks
+        self.response_cache = ResponseCache(maxsize=1024, ttl=3600)
+
+        # Routing rule -> handler, resolved once instead of an if/elif chain per task
+        self._route = {
+            "claude": self._complete_with_claude,
+            "chatgpt": self._complete_with_chatgpt,
+            "grok": self._complete_with_grok,
+            "grok_refine_then_claude": self._refine_with_grok_then_claude
+        }
+
+        # AI clients are created on first use, so a prompt only pays for the
+        # providers it is actually routed to. Tasks run on worker threads, so
+        # creation is locked to keep concurrent first use from building twice.
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.RLock()
+
         logger.info("AI Orchestrator initialized successfully")
 
+    def _client(self, name: str, factory):
+        """Return the named client, creating it with factory() on first use"""
+        client = self._clients.get(name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(name)
+                if client is None:
+                    client = self._clients[name] = factory()
+        return client
+
+    @property
+    def _http(self):
+        """Keep-alive connection pool shared by all API clients"""
+        return self._client('http', make_http_client)
+
+    def close(self):
+        """Close the shared connection pool, if it was created"""
+        # Clients bound to the closed pool are dropped and rebuilt on next use
+        with self._clients_lock:
+            http = self._clients.get('http')
+            self._clients.clear()
+        if http is not None:
+            http.close()
+
+    @property
+    def grok_client(self) -> GrokClient:
+        return self._client('grok', lambda: GrokClient(os.getenv('XAI_API_KEY'), http_client=self._http))
+
+    @property
+    def claude_client(self) -> ClaudeClient:
+        return self._client('claude', lambda: ClaudeClient(os.getenv('ANTHROPIC_API_KEY'), http_client=self._http))
+
+    @property
+    def chatgpt_client(self) -> ChatGPTClient:
+        return self._client('chatgpt', lambda: ChatGPTClient(os.getenv('OPENAI_API_KEY'), http_client=self._http))
+
     def process_prompt(self, user_prompt: str) -> Dict[str, Any]:
         """
         Main method to process a user prompt
@@ -53,24 +128,24 @@ class AIOrchestrator:
         Returns:
             Dictionary containing task breakdown, responses, and final output
         """
-        logger.info(f"Processing prompt: {user_prompt[:100]}...")
+        logger.info("Processing prompt: %.100s...", user_prompt)
 
         try:
             # Step 1: Analyze and break down the prompt
             tasks = self.task_analyzer.analyze(user_prompt)
-            logger.info(f"Identified {len(tasks)} tasks: {[t['type'] for t in tasks]}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Identified %d tasks: %s", len(tasks), [t['type'] for t in tasks])
 
             # Step 2: Process each task with appropriate model(s)
-            task_responses = []
-            for task in tasks:
-                response = self._process_task(task)
-                task_responses.append({
-                    'task': task,
-                    'response': response
-                })
+            responses = self._process_tasks(tasks)
 
             # Step 3: Combine responses into final output
-            final_output = self._combine_responses(user_prompt, task_responses)
+            final_output = self._combine_responses(user_prompt, tasks, responses)
+
+            task_responses = [
+                {'task': task, 'response': response}
+                for task, response in zip(tasks, responses)
+            ]
 
             return {
                 'success': True,
@@ -81,13 +156,105 @@ class AIOrchestrator:
             }
 
         except Exception as e:
-            logger.error(f"Error processing prompt: {str(e)}", exc_info=True)
+            logger.error("Error processing prompt: %s", e, exc_info=True)
             return {
                 'success': False,
                 'error': str(e),
                 'original_prompt': user_prompt
             }
 
+    def _process_tasks(self, tasks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Process all tasks of a prompt, returning responses in task order
+
+        Tasks routed to the same single model are batched into one call;
+        the resulting calls are independent, so they run concurrently.
+        """
+        responses = [""] * len(tasks)
+
+        # Each job answers the tasks at the given indices
+        jobs = []
+        batches: Dict[str, List[int]] = {}
+        for i, task in enumerate(tasks):
+            cached = self.response_cache.get(task['type'], task['content'])
+            if cached is not None:
+                logger.info("Using cached response for %s task", task['type'])
+                responses[i] = cached
+                continue
+
+            rule = self.config.get_routing_rule(task['type'])
+            if rule in self.BATCHABLE_RULES:
+                batches.setdefault(rule, []).append(i)
+            else:
+                jobs.append(([i], [task], None))
+        for rule, indices in batches.items():
+            group = [tasks[i] for i in indices]
+            jobs.append((indices, group, rule if len(group) > 1 else None))
+
+        def run(job) -> List[str]:
+            _, group, rule = job
+            if rule is None:
+                return [self._process_task(group[0])]
+            return self._process_batch(rule, group)
+
+        if len(jobs) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(jobs), self.MAX_PARALLEL_TASKS)) as executor:
+                results = list(executor.map(run, jobs))
+        else:
+            results = [run(job) for job in jobs]
+
+        for (indices, _, _), answers in zip(jobs, results):
+            for i, answer in zip(indices, answers):
+                responses[i] = answer
+        return responses
+
+    def _process_batch(self, routing_rule: str, tasks: List[Dict[str, Any]]) -> List[str]:
+        """
+        Answer several tasks routed to the same model with a single call
+
+        Falls back to one call per task if the batched call fails or its
+        response can't be split back into per-task answers.
+        """
+        logger.info("Batching %d tasks into one call with rule: %s", len(tasks), routing_rule)
+
+        parts = [_BATCH_PROMPT_HEADER]
+        for i, task in enumerate(tasks, 1):
+            parts.append(f"Task {i}:\n{task['content']}\n\n")
+        parts.append(_BATCH_PROMPT_FOOTER)
+
+        try:
+            answers = self._parse_batch_response(self._route[routing_rule]("".join(parts)), len(tasks))
+        except Exception as e:
+            logger.warning("Batched call failed: %s", e)
+            answers = None
+
+        if answers is None:
+            logger.warning("Could not split batched response, processing %d tasks individually", len(tasks))
+            return [self._process_task(task) for task in tasks]
+
+        for task, answer in zip(tasks, answers):
+            self.response_cache.put(task['type'], task['content'], answer)
+        return answers
+
+    @staticmethod
+    def _parse_batch_response(response: str, count: int) -> Optional[List[str]]:
+        """Extract per-task answers from a batched JSON response"""
+        text = response.strip()
+        if text.startswith("```"):
+            # Drop a markdown code fence around the JSON
+            text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        answers = [data.get(str(i)) for i in range(1, count + 1)]
+        if not all(isinstance(answer, str) for answer in answers):
+            return None
+        return answers
+
     def _process_task(self, task: Dict[str, Any]) -> str:
         """
         Process a single task based on its type
@@ -103,69 +270,75 @@ class AIOrchestrator:
 
         # Get routing rule from config
         routing_rule = self.config.get_routing_rule(task_type)
-        logger.info(f"Processing {task_type} task with rule: {routing_rule}")
+        logger.info("Processing %s task with rule: %s", task_type, routing_rule)
 
-        try:
-            if routing_rule == "claude":
-                logger.info("Using Claude directly (best for coding, writing, automation)")
-                response = self.claude_client.complete(task_content)
+        handler = self._route.get(routing_rule)
+        if handler is None:
+            # Default to ChatGPT as most versatile
+            logger.warning("Unknown routing rule: %s, defaulting to ChatGPT", routing_rule)
+            handler = self.chatgpt_client.complete
 
-            elif routing_rule == "chatgpt":
-                logger.info("Using ChatGPT directly (best for multimodal, data analysis, integration)")
-                response = self.chatgpt_client.complete(task_content)
+        try:
+            response = handler(task_content)
+            self.response_cache.put(task_type, task_content, response)
+            return response
 
-            elif routing_rule == "grok":
-                logger.info("Using Grok directly (best for math, real-time social, creative insights)")
-                response = self.grok_client.complete(task_content)
+        except Exception as e:
+            logger.error("Error processing task %s: %s", task_type, e)
+            return f"[Error processing task: {str(e)}]"
 
-            elif routing_rule == "grok_refine_then_claude":
-                # Legacy routing: Use Grok to refine the prompt, then Claude executes
-                logger.info("Step 1: Refining prompt with Grok")
-                refined_prompt = self.grok_client.refine_prompt(task_content)
-                logger.info(f"Grok refined prompt: {refined_prompt[:100]}...")
+    def _complete_with_claude(self, content: str) -> str:
+        """Route: Claude only"""
+        logger.info("Using Claude directly (best for coding, writing, automation)")
+        return self.claude_client.complete(content)
 
-                logger.info("Step 2: Generating response with Claude")
-                response = self.claude_client.complete(refined_prompt)
+    def _complete_with_chatgpt(self, content: str) -> str:
+        """Route: ChatGPT only"""
+        logger.info("Using ChatGPT directly (best for multimodal, data analysis, integration)")
+        return self.chatgpt_client.complete(content)
 
-            else:
-                # Default to ChatGPT as most versatile
-                logger.warning(f"Unknown routing rule: {routing_rule}, defaulting to ChatGPT")
-                response = self.chatgpt_client.complete(task_content)
+    def _complete_with_grok(self, content: str) -> str:
+        """Route: Grok only"""
+        logger.info("Using Grok directly (best for math, real-time social, creative insights)")
+        return self.grok_client.complete(content)
 
-            return response
+    def _refine_with_grok_then_claude(self, content: str) -> str:
+        """Route: Grok refines the prompt, then Claude executes (legacy)"""
+        logger.info("Step 1: Refining prompt with Grok")
+        refined_prompt = self.grok_client.refine_prompt(content)
+        logger.info("Grok refined prompt: %.100s...", refined_prompt)
 
-        except Exception as e:
-            logger.error(f"Error processing task {task_type}: {str(e)}")
-            return f"[Error processing task: {str(e)}]"
+        logger.info("Step 2: Generating response with Claude")
+        return self.claude_client.complete(refined_prompt)
 
-    def _combine_responses(self, original_prompt: str,
-                          task_responses: List[Dict]) -> str:
+    def _combine_responses(self, original_prompt: str, tasks: List[Dict[str, Any]],
+                          responses: List[str]) -> str:
         """
         Combine multiple task responses into a cohesive final output
 
         Args:
             original_prompt: The original user prompt
-            task_responses: List of task response dictionaries
+            tasks: Task dictionaries, in order
+            responses: Response string for each task, in the same order
 
         Returns:
             Combined final output string
         """
-        if len(task_responses) == 1:
+        if len(responses) == 1:
             # Single task, return response directly
-            return task_responses[0]['response']
+            return responses[0]
 
         # Multiple tasks, combine intelligently
-        combined = f"# Response to: {original_prompt}\n\n"
+        parts = [f"# Response to: {original_prompt}\n\n"]
 
-        for i, task_resp in enumerate(task_responses, 1):
-            task_type = task_resp['task']['type']
-            response = task_resp['response']
+        for i, (task, response) in enumerate(zip(tasks, responses), 1):
+            task_type = task['type']
 
-            combined += f"## Part {i}: {task_type.replace('_', ' ').title()}\n\n"
-            combined += f"{response}\n\n"
-            combined += "---\n\n"
+            parts.append(f"## Part {i}: {task_type.replace('_', ' ').title()}\n\n")
+            parts.append(f"{response}\n\n")
+            parts.append("---\n\n")
 
-        return combined.strip()
+        return "".join(parts).strip()
 
 
 def main():
@@ -177,7 +350,10 @@ def main():
     prompt = " ".join(sys.argv[1:])
 
     orchestrator = AIOrchestrator()
-    result = orchestrator.process_prompt(prompt)
+    try:
+        result = orchestrator.process_prompt(prompt)
+    finally:
+        orchestrator.close()
 
     if result['success']:
         print("\n" + "="*80)
@@ -0,0 +1,53 @@
+"""
+Response Cache - Bounded, expiring cache of model responses per task
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+class ResponseCache:
+    """LRU cache of task responses keyed by (task_type, content hash), with a TTL"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, bytes], Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(task_type: str, content: str) -> Tuple[str, bytes]:
+        """Key on a whitespace-normalized hash so trivially reformatted tasks match"""
+        normalized = _WHITESPACE_RE.sub(' ', content).strip()
+        return task_type, hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
+    def get(self, task_type: str, content: str) -> Optional[str]:
+        """Return the cached response for a task, or None"""
+        key = self._key(task_type, content)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, task_type: str, content: str, response: str):
+        """Cache a response for a task"""
+        key = self._key(task_type, content)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -3,7 +3,29 @@ Task Analyzer - Breaks down prompts into categorized sub-tasks
 """
 
 import re
-from typing import List, Dict, Any
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+# Numbered list items ("1. ", "2) ")
+_NUMBERED_RE = re.compile(r'\d+[\.\\)]\s+')
+
+# Connectives that separate requests, in priority order
+_SPLIT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\bthen\b',
+    r'\balso\b',
+    r'\badditionally\b',
+    r'\bafter that\b'
+))
+
+# Any of the connectives; lets prompts without one skip the ordered checks
+_ANY_SPLIT_RE = re.compile(r'\b(?:then|also|additionally|after that)\b', re.IGNORECASE)
+
+# Case-sensitive forms of the above, for matching an already-lowercased ASCII prompt
+_SPLIT_RES_LOWER = tuple(re.compile(split_re.pattern) for split_re in _SPLIT_RES)
+_ANY_SPLIT_RE_LOWER = re.compile(_ANY_SPLIT_RE.pattern)
+
+# Shortest prompt that can hold two requests ("a1. b")
+_MIN_SPLIT_LEN = 5
 
 
 class TaskAnalyzer:
@@ -11,7 +33,7 @@ class TaskAnalyzer:
 
     # Keywords for different task types
     # Based on AI Comparison Summary - Claude excels at coding
-    CODING_KEYWORDS = [
+    CODING_KEYWORDS = (
         'code', 'function', 'program', 'script', 'algorithm', 'debug',
         'implement', 'api', 'class', 'method', 'variable', 'python',
         'javascript', 'java', 'c++', 'programming', 'develop', 'build',
@@ -22,36 +44,36 @@ class TaskAnalyzer:
         'autonomous coding', 'long-term task', 'production code',
         'typescript', 'rust', 'go', 'kotlin', 'swift', 'ruby', 'php',
         'sql', 'database', 'backend', 'frontend', 'full stack'
-    ]
+    )
 
     # ChatGPT excels at summarization and versatile tasks
-    SUMMARIZATION_KEYWORDS = [
+    SUMMARIZATION_KEYWORDS = (
         'summarize', 'summary', 'tldr', 'brief', 'overview', 'digest',
         'condense', 'shorten', 'recap', 'key points', 'main ideas',
         'abstract', 'executive summary', 'synopsis', 'outline', 'review',
         'distill', 'extract', 'highlights', 'takeaways', 'conclusion'
-    ]
+    )
 
     # ChatGPT best for data analysis and multimodal
-    DATA_ANALYSIS_KEYWORDS = [
+    DATA_ANALYSIS_KEYWORDS = (
         'analyze', 'data', 'statistics', 'chart', 'graph', 'metrics',
         'trends', 'insights', 'visualization', 'dataset', 'csv', 'excel',
         'spreadsheet', 'pandas', 'numpy', 'analysis', 'statistical',
         'correlation', 'regression', 'forecast', 'prediction', 'model',
         'dashboard', 'report', 'kpi', 'analytics', 'business intelligence'
-    ]
+    )
 
     # Claude excels at creative writing and long-form content
-    CREATIVE_KEYWORDS = [
+    CREATIVE_KEYWORDS = (
         'write', 'story', 'poem', 'creative', 'imagine', 'fiction',
         'novel', 'character', 'plot', 'narrative', 'essay',
         'article', 'blog post', 'prose', 'dialogue', 'screenplay',
         'storytelling', 'author', 'composition', 'literary', 'creative writing',
         'long-form', 'detailed writing', 'nuanced', 'engaging narrative'
-    ]
+    )
 
     # Grok excels at mathematical and STEM reasoning
-    MATHEMATICAL_KEYWORDS = [
+    MATHEMATICAL_KEYWORDS = (
         'math', 'calculate', 'equation', 'formula', 'solve', 'proof',
         'theorem', 'calculus', 'algebra', 'geometry', 'trigonometry',
         'derivative', 'integral', 'matrix', 'vector', 'statistics',
@@ -59,67 +81,87 @@ class TaskAnalyzer:
         'aime', 'stem', 'physics', 'chemistry', 'biology', 'scientific',
         'research', 'hypothesis', 'experiment', 'quantum', 'computation',
         'number theory', 'discrete math', 'linear algebra', 'differential equations'
-    ]
+    )
 
     # Grok excels at real-time data and social intelligence
-    REALTIME_SOCIAL_KEYWORDS = [
+    REALTIME_SOCIAL_KEYWORDS = (
         'twitter', 'x.com', 'social media', 'trending', 'viral', 'sentiment',
         'real-time', 'live', 'breaking news', 'current events', 'latest',
         'social listening', 'brand monitoring', 'market sentiment', 'opinion',
         'public reaction', 'social trends', 'influencer', 'engagement',
         'hashtag', 'tweet', 'post', 'community feedback', 'buzz'
-    ]
+    )
 
     # ChatGPT excels at multimodal tasks (voice, video, image)
-    MULTIMODAL_KEYWORDS = [
+    MULTIMODAL_KEYWORDS = (
         'image', 'picture', 'photo', 'visual', 'video', 'audio', 'voice',
         'speech', 'generate image', 'create picture', 'draw', 'dalle',
         'illustration', 'diagram', 'infographic', 'multimodal', 'vision',
         'ocr', 'image analysis', 'face detection', 'object recognition',
         'transcribe', 'speech-to-text', 'text-to-speech', 'real-time voice'
-    ]
+    )
 
     # Claude excels at long-form reasoning and document processing
-    DOCUMENT_PROCESSING_KEYWORDS = [
+    DOCUMENT_PROCESSING_KEYWORDS = (
         'document', 'pdf', 'long document', 'book', 'manuscript', 'thesis',
         'research paper', 'academic', 'technical documentation', 'manual',
         'guide', 'comprehensive analysis', 'deep dive', 'detailed review',
         'full-book summary', 'literature review', 'annotate', 'cite',
         'reference', 'bibliography', 'extract from document', '200k context'
-    ]
+    )
 
     # Claude excels at professional and technical writing
-    PROFESSIONAL_WRITING_KEYWORDS = [
+    PROFESSIONAL_WRITING_KEYWORDS = (
         'technical writing', 'documentation', 'api docs', 'user guide',
         'specification', 'requirements', 'professional', 'business writing',
         'proposal', 'white paper', 'case study', 'report writing',
         'compliance', 'legal', 'contract', 'policy', 'procedure',
         'sop', 'standard operating procedure', 'technical specification'
-    ]
+    )
 
     # Grok excels at creative insights and unconventional perspectives
-    CREATIVE_INSIGHT_KEYWORDS = [
+    CREATIVE_INSIGHT_KEYWORDS = (
         'brainstorm', 'ideation', 'creative solution', 'think outside the box',
         'unique perspective', 'innovative', 'unconventional', 'original idea',
         'fresh approach', 'alternative viewpoint', 'creative problem solving',
         'lateral thinking', 'novel approach', 'inventive', 'imaginative solution'
-    ]
+    )
 
     # Claude excels at desktop automation and UI tasks
-    AUTOMATION_KEYWORDS = [
+    AUTOMATION_KEYWORDS = (
         'automate', 'automation', 'gui', 'ui automation', 'desktop',
         'click', 'navigate', 'process automation', 'workflow',
         'rpa', 'robotic process automation', 'macro', 'script automation',
         'selenium', 'puppeteer', 'computer use', 'control interface'
-    ]
+    )
 
     # ChatGPT excels at integration and API tasks
-    INTEGRATION_KEYWORDS = [
+    INTEGRATION_KEYWORDS = (
         'integrate', 'api integration', 'webhook', 'zapier', 'connector',
         'third-party', 'service integration', 'rest api', 'graphql',
         'microservice', 'plugin', 'extension', 'middleware', 'oauth',
         'authentication', 'authorization', 'endpoint', 'sdk'
-    ]
+    )
+
+    # Scored categories, in tie-break order
+    CATEGORIES = (
+        ('coding', CODING_KEYWORDS),
+        ('summarization', SUMMARIZATION_KEYWORDS),
+        ('data_analysis', DATA_ANALYSIS_KEYWORDS),
+        ('creative_writing', CREATIVE_KEYWORDS),
+        ('mathematical_reasoning', MATHEMATICAL_KEYWORDS),
+        ('realtime_social', REALTIME_SOCIAL_KEYWORDS),
+        ('multimodal', MULTIMODAL_KEYWORDS),
+        ('document_processing', DOCUMENT_PROCESSING_KEYWORDS),
+        ('professional_writing', PROFESSIONAL_WRITING_KEYWORDS),
+        ('creative_insight', CREATIVE_INSIGHT_KEYWORDS),
+        ('automation', AUTOMATION_KEYWORDS),
+        ('integration', INTEGRATION_KEYWORDS),
+    )
+    _CATEGORY_NAMES = tuple(name for name, _ in CATEGORIES)
+
+    # Stateless: all keyword tables are shared class-level tuples
+    __slots__ = ()
 
     def __init__(self):
         pass
@@ -134,17 +176,23 @@ class TaskAnalyzer:
         Returns:
             List of task dictionaries with 'type' and 'content'
         """
+        # Lowercase once; shared by the split checks and single-task categorization
+        prompt_lower = prompt.lower()
+
         # Check if prompt contains multiple distinct requests
-        tasks = self._split_multiple_requests(prompt)
+        if len(prompt) < _MIN_SPLIT_LEN:
+            tasks = [prompt]
+        else:
+            tasks = self._split_multiple_requests(prompt, prompt_lower)
 
         if len(tasks) > 1:
             # Multiple requests found, categorize each
             return [self._categorize_task(task) for task in tasks]
         else:
             # Single task, categorize it
-            return [self._categorize_task(prompt)]
+            return [self._categorize_task(prompt, prompt_lower)]
 
-    def _split_multiple_requests(self, prompt: str) -> List[str]:
+    def _split_multiple_requests(self, prompt: str, prompt_lower: Optional[str] = None) -> List[str]:
         """
         Split prompt into multiple requests if present
 
@@ -154,79 +202,86 @@ class TaskAnalyzer:
         - "Also, ..."
         """
         # Check for numbered lists
-        numbered_pattern = r'\d+[\.\\)]\s+'
-        if re.search(numbered_pattern, prompt):
-            parts = re.split(numbered_pattern, prompt)
+        if _NUMBERED_RE.search(prompt):
+            parts = _NUMBERED_RE.split(prompt)
             return [p.strip() for p in parts if p.strip()]
 
+        if prompt.isascii():
+            # Lowercasing ASCII keeps every offset, so match case-sensitively
+            # on the lowered text and cut the original at the same span
+            if prompt_lower is None:
+                prompt_lower = prompt.lower()
+            if _ANY_SPLIT_RE_LOWER.search(prompt_lower):
+                for split_re in _SPLIT_RES_LOWER:
+                    match = split_re.search(prompt_lower)
+                    if match:
+                        parts = (prompt[:match.start()], prompt[match.end():])
+                        return [p.strip() for p in parts if p.strip()]
+            return [prompt]
+
         # Check for "and also", "then", "additionally" patterns
-        split_patterns = [
-            r'\bthen\b',
-            r'\balso\b',
-            r'\badditionally\b',
-            r'\bafter that\b'
-        ]
-
-        for pattern in split_patterns:
-            if re.search(pattern, prompt, re.IGNORECASE):
-                parts = re.split(pattern, prompt, maxsplit=1, flags=re.IGNORECASE)
+        if _ANY_SPLIT_RE.search(prompt):
+            for split_re in _SPLIT_RES:
+                parts = split_re.split(prompt, maxsplit=1)
                 if len(parts) > 1:
                     return [p.strip() for p in parts if p.strip()]
 
         # No clear split found, return as single task
         return [prompt]
 
-    def _categorize_task(self, task: str) -> Dict[str, Any]:
+    def _categorize_task(self, task: str, task_lower: Optional[str] = None) -> Dict[str, Any]:
         """
         Categorize a single task based on keywords
 
         Args:
             task: Task string to categorize
+            task_lower: task.lower(), if the caller already has it
 
         Returns:
             Dictionary with 'type' and 'content' keys
         """
-        task_lower = task.lower()
-
-        # Count keyword matches for each category
-        coding_score = sum(1 for kw in self.CODING_KEYWORDS if kw in task_lower)
-        summary_score = sum(1 for kw in self.SUMMARIZATION_KEYWORDS if kw in task_lower)
-        data_score = sum(1 for kw in self.DATA_ANALYSIS_KEYWORDS if kw in task_lower)
-        creative_score = sum(1 for kw in self.CREATIVE_KEYWORDS if kw in task_lower)
-        math_score = sum(1 for kw in self.MATHEMATICAL_KEYWORDS if kw in task_lower)
-        realtime_score = sum(1 for kw in self.REALTIME_SOCIAL_KEYWORDS if kw in task_lower)
-        multimodal_score = sum(1 for kw in self.MULTIMODAL_KEYWORDS if kw in task_lower)
-        document_score = sum(1 for kw in self.DOCUMENT_PROCESSING_KEYWORDS if kw in task_lower)
-        professional_score = sum(1 for kw in self.PROFESSIONAL_WRITING_KEYWORDS if kw in task_lower)
-        insight_score = sum(1 for kw in self.CREATIVE_INSIGHT_KEYWORDS if kw in task_lower)
-        automation_score = sum(1 for kw in self.AUTOMATION_KEYWORDS if kw in task_lower)
-        integration_score = sum(1 for kw in self.INTEGRATION_KEYWORDS if kw in task_lower)
-
-        # Determine task type based on highest score
-        scores = {
-            'coding': coding_score,
-            'summarization': summary_score,
-            'data_analysis': data_score,
-            'creative_writing': creative_score,
-            'mathematical_reasoning': math_score,
-            'realtime_social': realtime_score,
-            'multimodal': multimodal_score,
-            'document_processing': document_score,
-            'professional_writing': professional_score,
-            'creative_insight': insight_score,
-            'automation': automation_score,
-            'integration': integration_score,
-            'general': 0  # Default category
-        }
-
-        task_type = max(scores, key=scores.get)
+        if task_lower is None:
+            task_lower = task.lower()
+
+        # Test each distinct keyword once (a substring search in C) and credit
+        # every category it belongs to. The plain `in` test beats driving
+        # task_lower.__contains__ through map()/compress(), which pays a
+        # slot-wrapper call per keyword
+        counts = [0] * len(self._CATEGORY_NAMES)
+        for keyword, categories in self._ALL_KEYWORDS:
+            if keyword in task_lower:
+                for i in categories:
+                    counts[i] += 1
+
+        # Determine task type based on highest score; ties go to the category
+        # listed first
+        best = max(counts)
 
         # If no strong match, classify as general
-        if scores[task_type] == 0:
+        if best == 0:
             task_type = 'general'
+        else:
+            task_type = self._CATEGORY_NAMES[counts.index(best)]
 
         return {
             'type': task_type,
             'content': task,
-            'confidence': scores[task_type]
+            'confidence': best
         }
+
+
+def _build_keyword_index(categories: Sequence[Tuple[str, Sequence[str]]]) -> MappingProxyType:
+    """
+    Map each distinct keyword to the indices of the categories it belongs to
+    """
+    keyword_categories: Dict[str, List[int]] = {}
+    for i, (_, keywords) in enumerate(categories):
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, []).append(i)
+    return MappingProxyType({keyword: tuple(indices) for keyword, indices in keyword_categories.items()})
+
+
+# Built once at import and shared by all analyzers: a read-only keyword ->
+# categories index, and the same pairs as a flat tuple for the scoring loop
+TaskAnalyzer.KEYWORD_INDEX = _build_keyword_index(TaskAnalyzer.CATEGORIES)
+TaskAnalyzer._ALL_KEYWORDS = tuple(TaskAnalyzer.KEYWORD_INDEX.items())
@@ -2,7 +2,10 @@ import asyncio
 import click
 import sys
 import json
-from ai3core.engine import Ai3Core
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ai3core.engine import Ai3Core
 
 
 @click.command()
@@ -18,6 +21,9 @@ def main(prompt: str, stream: bool, max_concurrency: int, planner_model: str):
     os.environ["AI3_MAX_CONCURRENCY"] = str(max_concurrency)
     os.environ["AI3_PLANNER_MODEL"] = planner_model
 
+    # Imported after option parsing so --help and usage errors skip loading the
+    # engine, and so settings read at import time see the overrides above
+    from ai3core.engine import Ai3Core
     engine = Ai3Core()
 
     if stream:
@@ -26,7 +32,7 @@ def main(prompt: str, stream: bool, max_concurrency: int, planner_model: str):
         asyncio.run(run_non_streaming(engine, prompt))
 
 
-async def run_non_streaming(engine: Ai3Core, prompt: str):
+async def run_non_streaming(engine: "Ai3Core", prompt: str):
     """Non-streaming CLI execution."""
     click.echo("Running orchestration (non-streaming)...")
     result = await engine.run(prompt, stream=False)
@@ -37,80 +43,106 @@ async def run_non_streaming(engine: Ai3Core, prompt: str):
     click.echo(json.dumps(result["stats"], indent=2))
 
 
-async def run_streaming(engine: Ai3Core, prompt: str):
+async def run_streaming(engine: "Ai3Core", prompt: str):
     """Streaming CLI execution with live progress."""
     click.echo("Running orchestration (streaming)...\n")
 
     spinners = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
     spinner_idx = 0
+    spinner_task = None
     task_status = {}
 
-    events = []
-
-    async def stream_callback(event: dict):
-        events.append(event)
-
-    # Mock streaming for demonstration
-    # In production, engine.run would call stream_callback for each event
-
-    # Simulate events
-    sample_events = [
-        {"type": "plan", "status": "started"},
-        {"type": "plan", "status": "completed", "task_count": 3},
-        {"type": "task_start", "task_id": "t1", "description": "Generate introduction"},
-        {"type": "decision", "task_id": "t1", "provider": "anthropic-claude"},
-        {"type": "task_artifact", "task_id": "t1"},
-        {"type": "task_verified", "task_id": "t1"},
-        {"type": "task_start", "task_id": "t2", "description": "Generate body"},
-        {"type": "decision", "task_id": "t2", "provider": "openai-gpt4"},
-        {"type": "task_artifact", "task_id": "t2"},
-        {"type": "task_verified", "task_id": "t2"},
-        {"type": "assemble_start"},
-        {"type": "final", "output": "Complete assembled output"},
-        {"type": "stats", "stats": {"task_count": 3, "total_cost": 0.05, "total_tokens": 1500}}
-    ]
-
-    for event in sample_events:
+    # Only animate on a terminal; piped output gets plain lines
+    interactive = sys.stdout.isatty()
+
+    # Lines rendered for the current event, written out in one go
+    pending = []
+
+    def echo(line: str):
+        pending.append(line)
+
+    async def spin():
+        """Animate a status line while any task is running."""
+        nonlocal spinner_idx
+        while True:
+            running = sum(1 for status in task_status.values() if status == "running")
+            if not running:
+                break
+            click.echo(f"\r{spinners[spinner_idx % len(spinners)]} {running} task(s) running", nl=False)
+            spinner_idx += 1
+            await asyncio.sleep(0.08)
+        click.echo("\r\033[K", nl=False)
+
+    def render_event(event: dict):
+        nonlocal spinner_idx, spinner_task
         event_type = event.get("type")
 
         if event_type == "plan":
             if event.get("status") == "started":
-                click.echo(f"{spinners[spinner_idx % len(spinners)]} Planning...")
+                echo(f"{spinners[spinner_idx % len(spinners)]} Planning...")
             else:
-                click.echo(f"✓ Plan complete: {event.get('task_count')} tasks")
+                echo(f"✓ Plan complete: {event.get('task_count')} tasks")
 
         elif event_type == "task_start":
             task_id = event.get("task_id")
             desc = event.get("description", "")
             task_status[task_id] = "running"
-            click.echo(f"{spinners[spinner_idx % len(spinners)]} {task_id}: {desc}")
+            echo(f"{spinners[spinner_idx % len(spinners)]} {task_id}: {desc}")
+            if interactive and (spinner_task is None or spinner_task.done()):
+                spinner_task = asyncio.create_task(spin())
 
         elif event_type == "decision":
             task_id = event.get("task_id")
             provider = event.get("provider")
-            click.echo(f"  → Routed to {provider}")
+            echo(f"  → Routed to {provider}")
 
         elif event_type == "task_verified":
             task_id = event.get("task_id")
             task_status[task_id] = "done"
-            click.echo(f"  ✓ {task_id} verified")
+            echo(f"  ✓ {task_id} verified")
+
+        elif event_type == "task_repaired":
+            task_id = event.get("task_id")
+            task_status[task_id] = "repaired"
+            echo(f"  ↻ {task_id} repaired (attempt {event.get('attempt')})")
+
+        elif event_type == "task_failed":
+            task_id = event.get("task_id")
+            task_status[task_id] = "failed"
+            echo(f"  ✗ {task_id} failed: {event.get('error', '')}")
 
         elif event_type == "assemble_start":
-            click.echo(f"\n{spinners[spinner_idx % len(spinners)]} Assembling final output...")
+            echo(f"\n{spinners[spinner_idx % len(spinners)]} Assembling final output...")
 
         elif event_type == "final":
-            click.echo("\n=== FINAL OUTPUT ===")
-            click.echo(event.get("output", ""))
+            echo("\n=== FINAL OUTPUT ===")
+            echo(event.get("output", ""))
 
         elif event_type == "stats":
             stats = event.get("stats", {})
-            click.echo("\n=== STATS ===")
-            click.echo(f"Tasks: {stats.get('task_count', 0)}")
-            click.echo(f"Cost: ${stats.get('total_cost', 0):.4f}")
-            click.echo(f"Tokens: {stats.get('total_tokens', 0)}")
+            echo("\n=== STATS ===")
+            echo(f"Tasks: {stats.get('task_count', 0)}")
+            echo(f"Cost: ${stats.get('total_cost', 0):.4f}")
+            echo(f"Tokens: {stats.get('total_tokens', 0)}")
+
+        elif event_type == "error":
+            echo(f"✗ Error: {event.get('message', '')}")
 
         spinner_idx += 1
-        await asyncio.sleep(0.3)
+
+        if pending:
+            # One write (and flush) per event instead of one per line
+            prefix = "\r\033[K" if interactive else ""  # Clear the spinner line
+            click.echo(prefix + "\n".join(pending))
+            pending.clear()
+
+    # Events are rendered as the engine emits them
+    try:
+        await engine.run(prompt, stream=True, on_event=render_event)
+    finally:
+        if spinner_task is not None and not spinner_task.done():
+            spinner_task.cancel()
+            click.echo("\r\033[K", nl=False)
 
 
 if __name__ == "__main__":
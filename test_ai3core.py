@@ -6,17 +6,52 @@ This tests the core modules without requiring API keys
 """
 
 import sys
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
 # Add to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def test_planner():
+from ai3core.assembler import Assembler
+from ai3core.journal import ArtifactStore
+from ai3core.planner.planner import Planner
+from ai3core.registry import CapabilityRegistry
+from ai3core.router import Router
+from ai3core.types import ExecutionArtifact, ModelProvider, Task
+from ai3core.verifier import Verifier
+
+
+# Components are built once per module; none of the tests mutate them
+@pytest.fixture(scope="module")
+def planner():
+    return Planner()
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return CapabilityRegistry()
+
+
+@pytest.fixture(scope="module")
+def router(registry):
+    return Router(registry)
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    return Verifier()
+
+
+@pytest.fixture(scope="module")
+def assembler():
+    return Assembler()
+
+
+def test_planner(planner):
     """Test the Planner module"""
     print("Testing Planner...")
-    from ai3core.planner import Planner
-
-    planner = Planner()
 
     # Test simple task
     plan = planner.create_plan("Write a hello world program")
@@ -37,12 +72,9 @@ def test_planner():
     print()
 
 
-def test_registry():
+def test_registry(registry):
     """Test the Capability Registry"""
     print("Testing Capability Registry...")
-    from ai3core.registry import CapabilityRegistry
-
-    registry = CapabilityRegistry()
 
     # Test model loading
     models = registry.get_all_models()
@@ -62,15 +94,9 @@ def test_registry():
     print()
 
 
-def test_router():
+def test_router(registry, router):
     """Test the Router module"""
     print("Testing Router...")
-    from ai3core.router import Router
-    from ai3core.registry import CapabilityRegistry
-    from ai3core.types import Task
-
-    registry = CapabilityRegistry()
-    router = Router(registry)
 
     # Create test task
     task = Task(
@@ -92,14 +118,9 @@ def test_router():
     print()
 
 
-def test_verifier():
+def test_verifier(verifier):
     """Test the Verifier module"""
     print("Testing Verifier...")
-    from ai3core.verifier import Verifier
-    from ai3core.types import ExecutionArtifact, Task, ModelProvider
-    from datetime import datetime
-
-    verifier = Verifier()
 
     task = Task(
         id="test1",
@@ -130,14 +151,9 @@ def test_verifier():
     print()
 
 
-def test_assembler():
+def test_assembler(assembler):
     """Test the Assembler module"""
     print("Testing Assembler...")
-    from ai3core.assembler import Assembler
-    from ai3core.types import ExecutionArtifact, Task, ModelProvider
-    from datetime import datetime
-
-    assembler = Assembler()
 
     # Create test artifacts
     artifacts = [
@@ -180,87 +196,42 @@ def test_assembler():
     print()
 
 
-def test_journal():
+def test_journal(tmp_path):
     """Test the Journal system"""
     print("Testing Journal & Artifact Store...")
-    from ai3core.journal import RunJournal, ArtifactStore
-    from ai3core.types import ExecutionArtifact, ModelProvider
-    from datetime import datetime
-    import tempfile
-    import shutil
-
-    # Use temp directory
-    temp_dir = tempfile.mkdtemp()
 
-    try:
-        artifact_store = ArtifactStore(storage_dir=f"{temp_dir}/artifacts")
+    artifact_store = ArtifactStore(storage_dir=str(tmp_path / "artifacts"))
 
-        # Create test artifact
-        artifact = ExecutionArtifact(
-            task_id="test1",
-            model_id="claude-3-7-sonnet-20250219",
-            provider=ModelProvider.ANTHROPIC,
-            prompt="Test prompt",
-            response="Test response",
-            metadata={},
-            token_usage={"input": 10, "output": 20, "total": 30},
-            latency_ms=1000.0,
-            timestamp=datetime.now(),
-            success=True
-        )
-
-        # Store and retrieve
-        artifact_id = artifact_store.store(artifact)
-        retrieved = artifact_store.retrieve(artifact_id)
-
-        assert retrieved is not None, "Should retrieve artifact"
-        assert retrieved.response == artifact.response, "Response should match"
-        print(f"  ✓ Artifact store: Stored and retrieved artifact")
+    # Create test artifact
+    artifact = ExecutionArtifact(
+        task_id="test1",
+        model_id="claude-3-7-sonnet-20250219",
+        provider=ModelProvider.ANTHROPIC,
+        prompt="Test prompt",
+        response="Test response",
+        metadata={},
+        token_usage={"input": 10, "output": 20, "total": 30},
+        latency_ms=1000.0,
+        timestamp=datetime.now(),
+        success=True
+    )
 
-        stats = artifact_store.get_stats()
-        print(f"  ✓ Total artifacts: {stats['total_artifacts']}")
+    # Store and retrieve
+    artifact_id = artifact_store.store(artifact)
+    retrieved = artifact_store.retrieve(artifact_id)
 
-    finally:
-        # Cleanup
-        shutil.rmtree(temp_dir)
+    assert retrieved is not None, "Should retrieve artifact"
+    assert retrieved.response == artifact.response, "Response should match"
+    print(f"  ✓ Artifact store: Stored and retrieved artifact")
 
+    stats = artifact_store.get_stats()
+    print(f"  ✓ Total artifacts: {stats['total_artifacts']}")
     print()
 
 
 def main():
     """Run all tests"""
-    print("="*80)
-    print("AI3CORE COMPONENT TESTS")
-    print("="*80)
-    print()
-
-    try:
-        test_planner()
-        test_registry()
-        test_router()
-        test_verifier()
-        test_assembler()
-        test_journal()
-
-        print("="*80)
-        print("✓ ALL TESTS PASSED")
-        print("="*80)
-        print()
-        print("Ai3Core is ready to use!")
-        print()
-        print("Next steps:")
-        print("1. Copy .env.example to .env and add your API keys")
-        print("2. Run: python -m interface.cli.main 'your prompt here'")
-        print()
-
-    except AssertionError as e:
-        print(f"\n✗ TEST FAILED: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n✗ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-v"]))
 
 
 if __name__ == "__main__":
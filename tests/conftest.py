@@ -0,0 +1,30 @@
+import asyncio
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration",
+        action="store_true",
+        default=False,
+        help="Run integration tests that call real LLM providers",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration tests at collection time unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop shared by all async tests instead of a new loop per test."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
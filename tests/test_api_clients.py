@@ -0,0 +1,45 @@
+import pytest
+from backend.api_clients import BaseAPIClient, CircuitBreaker, CircuitOpenError
+
+
+def _tripped_breaker():
+    """Breaker that has just opened and is immediately due for a trial call."""
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=0.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    return breaker
+
+
+def test_half_open_allows_single_trial():
+    """Only one caller gets through while the half-open trial is in flight."""
+    breaker = _tripped_breaker()
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    breaker.before_call()
+    breaker.before_call()
+
+
+def test_failed_trial_reopens_circuit():
+    """A failed trial re-opens the circuit for a fresh reset_timeout."""
+    breaker = _tripped_breaker()
+    breaker.before_call()
+    breaker.reset_timeout = 60.0
+    breaker.record_failure()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_interrupted_trial_is_released():
+    """A trial ended by a non-Exception error doesn't block later calls."""
+    client = BaseAPIClient("key")
+    client._breaker = _tripped_breaker()
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        client._retry_request(interrupted)
+    assert client._retry_request(lambda: "ok") == "ok"
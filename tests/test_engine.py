@@ -0,0 +1,43 @@
+import asyncio
+import pytest
+import ai3core.engine as engine_module
+from ai3core.engine import Ai3Core
+
+
+class FakeProvider:
+    """Provider stub whose usage identifies the prompt that produced it."""
+
+    async def generate(self, prompt: str):
+        await asyncio.sleep(0)
+        return {"content": prompt, "usage": {"cost": 0.5, "total_tokens": len(prompt)}}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Engine writing journal and telemetry under tmp_path, with stubbed planning."""
+    monkeypatch.setattr("ai3core.journal.store.JOURNAL_DIR", tmp_path / "runs")
+    monkeypatch.setattr("ai3core.telemetry.metrics.TELEMETRY_DIR", tmp_path / "telemetry")
+    (tmp_path / "runs").mkdir()
+    (tmp_path / "telemetry").mkdir()
+
+    async def make_plan(user_input):
+        # Yield so concurrent runs interleave their planning and execution
+        await asyncio.sleep(0)
+        count = int(user_input)
+        return {"tasks": [{"id": f"t{i}", "description": "x" * count} for i in range(count)], "edges": []}
+
+    monkeypatch.setattr(engine_module, "make_plan", make_plan)
+    monkeypatch.setattr(engine_module, "select_provider", lambda task, telemetry: "anthropic-claude")
+
+    core = Ai3Core()
+    core._providers["anthropic"] = FakeProvider()
+    yield core
+    core.telemetry.close()
+
+
+async def test_concurrent_runs_get_their_own_stats(engine):
+    """Concurrent runs on one engine must not mix their telemetry."""
+    small, large = await asyncio.gather(engine.run("2"), engine.run("5"))
+
+    assert small["stats"] == {"task_count": 2, "decision_count": 2, "total_cost": 1.0, "total_tokens": 4}
+    assert large["stats"] == {"task_count": 5, "decision_count": 5, "total_cost": 2.5, "total_tokens": 25}
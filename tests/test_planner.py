@@ -51,6 +51,7 @@ def test_validate_task_graph_rejects_invalid_edges():
         validate_task_graph(data)
 
 
+@pytest.mark.integration
 @pytest.mark.asyncio
 async def test_make_plan_integration():
     """Integration test for make_plan (requires mock or actual LLM)."""
@@ -2,57 +2,51 @@ import pytest
 from ai3core.executor.scheduler import topological_sort, compute_ready_sets
 
 
-def test_topological_sort_linear():
-    """Test topological sort on linear dependency chain."""
-    tasks = [{"id": "t1"}, {"id": "t2"}, {"id": "t3"}]
-    edges = [{"from": "t1", "to": "t2"}, {"from": "t2", "to": "t3"}]
+def _chain(*ids):
+    """Edges linking the given task IDs in order."""
+    return [{"from": a, "to": b} for a, b in zip(ids, ids[1:])]
+
+
+def _tasks(*ids):
+    return [{"id": task_id} for task_id in ids]
+
+
+# (tasks, edges, expected): expected is the order as consecutive groups whose
+# members may appear in any order, or the exception the sort must raise
+TOPO_CASES = [
+    (_tasks("t1", "t2", "t3"), _chain("t1", "t2", "t3"), [{"t1"}, {"t2"}, {"t3"}]),
+    (_tasks("t1", "t2", "t3"), _chain("t1", "t2") + _chain("t1", "t3"), [{"t1"}, {"t2", "t3"}]),
+    (_tasks("t1", "t2"), _chain("t1", "t2", "t1"), ValueError),
+]
+
+READY_CASES = [
+    (_tasks("t1", "t2"), _chain("t1", "t2"), [{"t1"}, {"t2"}]),
+    (_tasks("t1", "t2", "t3"), [], [{"t1", "t2", "t3"}]),
+    (
+        _tasks("t1", "t2", "t3", "t4"),
+        _chain("t1", "t2", "t4") + _chain("t1", "t3", "t4"),
+        [{"t1"}, {"t2", "t3"}, {"t4"}],
+    ),
+]
+
+
+@pytest.mark.parametrize("tasks,edges,expected", TOPO_CASES, ids=["linear", "parallel", "cycle"])
+def test_topological_sort(tasks, edges, expected):
+    """Test topological sort ordering and cycle detection."""
+    if expected is ValueError:
+        with pytest.raises(ValueError, match="Cycle detected"):
+            topological_sort(tasks, edges)
+        return
+
     result = topological_sort(tasks, edges)
-    assert result == ["t1", "t2", "t3"]
+    assert len(result) == sum(len(group) for group in expected)
+    start = 0
+    for group in expected:
+        assert set(result[start:start + len(group)]) == group
+        start += len(group)
 
 
-def test_topological_sort_parallel():
-    """Test topological sort with parallel branches."""
-    tasks = [{"id": "t1"}, {"id": "t2"}, {"id": "t3"}]
-    edges = [{"from": "t1", "to": "t2"}, {"from": "t1", "to": "t3"}]
-    result = topological_sort(tasks, edges)
-    assert result[0] == "t1"
-    assert set(result[1:]) == {"t2", "t3"}
-
-
-def test_topological_sort_cycle_detection():
-    """Test cycle detection in topological sort."""
-    tasks = [{"id": "t1"}, {"id": "t2"}]
-    edges = [{"from": "t1", "to": "t2"}, {"from": "t2", "to": "t1"}]
-    with pytest.raises(ValueError, match="Cycle detected"):
-        topological_sort(tasks, edges)
-
-
-def test_compute_ready_sets_sequential():
-    """Test ready sets for sequential dependencies."""
-    tasks = [{"id": "t1"}, {"id": "t2"}]
-    edges = [{"from": "t1", "to": "t2"}]
-    result = compute_ready_sets(tasks, edges)
-    assert result == [{"t1"}, {"t2"}]
-
-
-def test_compute_ready_sets_parallel():
-    """Test ready sets for parallel execution."""
-    tasks = [{"id": "t1"}, {"id": "t2"}, {"id": "t3"}]
-    edges = []
-    result = compute_ready_sets(tasks, edges)
-    assert result == [{"t1", "t2", "t3"}]
-
-
-def test_compute_ready_sets_diamond():
-    """Test ready sets for diamond-shaped DAG."""
-    tasks = [{"id": "t1"}, {"id": "t2"}, {"id": "t3"}, {"id": "t4"}]
-    edges = [
-        {"from": "t1", "to": "t2"},
-        {"from": "t1", "to": "t3"},
-        {"from": "t2", "to": "t4"},
-        {"from": "t3", "to": "t4"}
-    ]
-    result = compute_ready_sets(tasks, edges)
-    assert result[0] == {"t1"}
-    assert result[1] == {"t2", "t3"}
-    assert result[2] == {"t4"}
+@pytest.mark.parametrize("tasks,edges,expected", READY_CASES, ids=["sequential", "parallel", "diamond"])
+def test_compute_ready_sets(tasks, edges, expected):
+    """Test ready sets for sequential, parallel and diamond-shaped DAGs."""
+    assert compute_ready_sets(tasks, edges) == expected
@@ -4,7 +4,6 @@ from ai3core.verifier.verify import verify_artifact, should_repair, should_fallb
 from ai3core.settings import AI3_VERIFY, AI3_REPAIR_LIMIT
 
 
-@pytest.mark.asyncio
 async def test_verify_artifact_passes():
     """Test verification passes for valid content."""
     artifact = {
@@ -17,7 +16,6 @@ async def test_verify_artifact_passes():
     assert result["meta"]["verification"]["status"] == "passed"
 
 
-@pytest.mark.asyncio
 async def test_verify_artifact_fails():
     """Test verification fails for invalid content."""
     artifact = {
@@ -31,7 +29,6 @@ async def test_verify_artifact_fails():
     assert len(result["meta"]["verification"]["failures"]) > 0
 
 
-@pytest.mark.asyncio
 async def test_verify_artifact_repair_attempted():
     """Test verification marks repair attempt."""
     artifact = {